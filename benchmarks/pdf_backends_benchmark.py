@@ -0,0 +1,162 @@
+"""
+Benchmark of the pdf backends (tabula and pdfplumber) on the card details pdf.
+
+Each backend runs in a new process, so the startup time includes the imports (and the
+Java VM of tabula). It reports:
+    - startup: seconds until the tables of the first page are extracted.
+    - throughput: pages per second of the whole pdf (after the startup).
+    - peak RSS: maximum resident memory of the process (and its children), in MB.
+Then the Dataframes of the backends are compared (same layout as retrieve_pdf_data).
+
+Usage:
+    python benchmarks/pdf_backends_benchmark.py --pdf data/card_details.pdf
+"""
+
+import time
+
+START: float = time.perf_counter()
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import requests
+from pandas import DataFrame
+
+from database_manager import pdf_backends
+
+try:
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
+
+CARD_DETAILS_URL = (
+    "https://data-handling-public.s3.eu-west-1.amazonaws.com/card_details.pdf"
+)
+
+
+def run_backend(pdf_path: str, backend: str, output_path: str) -> Dict:
+    """
+    Extract the pdf with the backend (in this process) and save the Dataframe.
+
+    * Parameters:
+        - pdf_path: string
+        - backend: string
+        - output_path: string
+    """
+    pdf_backends.read_pdf(pdf_path, [1], backend)
+    startup: float = time.perf_counter() - START
+
+    start: float = time.perf_counter()
+    dfs: List[DataFrame] = pdf_backends.read_pdf(pdf_path, "all", backend)
+    elapsed: float = time.perf_counter() - start
+    df: DataFrame = pd.concat(dfs).reset_index(level=0)
+    df.to_pickle(output_path)
+
+    # Without pypdf, the pages are counted as one table per page.
+    pages: int = len(PdfReader(pdf_path).pages) if PdfReader else len(dfs)
+    peak_rss: int = (
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        + resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    )
+    return {
+        "backend": backend,
+        "startup": startup,
+        "pages_per_second": pages / elapsed,
+        "peak_rss_mb": peak_rss / 1024,
+        "rows": len(df),
+    }
+
+
+def compare_frames(expected: DataFrame, actual: DataFrame) -> str:
+    """
+    Describe the differences between the Dataframes of two backends.
+
+    * Parameters:
+        - expected: Dataframe
+        - actual: Dataframe
+    """
+    if expected.equals(actual):
+        return "identical"
+    if list(expected.columns) != list(actual.columns):
+        return f"different columns: {list(expected.columns)} != {list(actual.columns)}"
+    if expected.shape != actual.shape:
+        return f"different shapes: {expected.shape} != {actual.shape}"
+    different_cells: int = int(
+        (expected.astype(str).to_numpy() != actual.astype(str).to_numpy()).sum()
+    )
+    different_dtypes: List[str] = [
+        column
+        for column in expected.columns
+        if expected[column].dtype != actual[column].dtype
+    ]
+    return f"{different_cells} different cells, different dtypes in {different_dtypes}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pdf", default=CARD_DETAILS_URL, help="url or local path")
+    parser.add_argument(
+        "--backends", nargs="+", default=pdf_backends.available_backends()
+    )
+    parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--output", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_backend(args.pdf, args.worker, args.output)))
+        sys.exit(0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        pdf_path: str = args.pdf
+        if pdf_path.startswith(("http://", "https://")):
+            response = requests.get(pdf_path, timeout=60)
+            response.raise_for_status()
+            pdf_path = os.path.join(directory, "document.pdf")
+            with open(pdf_path, "wb") as file:
+                file.write(response.content)
+
+        print(
+            f"{'BACKEND':<12} {'STARTUP':>10} {'PAGES/S':>10} {'PEAK RSS':>11} {'ROWS':>8}"
+        )
+        dfs: Dict[str, DataFrame] = {}
+        for backend in args.backends:
+            output_path: str = os.path.join(directory, f"{backend}.pkl")
+            process = subprocess.run(
+                [
+                    sys.executable,
+                    os.path.abspath(__file__),
+                    "--pdf",
+                    pdf_path,
+                    "--worker",
+                    backend,
+                    "--output",
+                    output_path,
+                ],
+                capture_output=True,
+                text=True,
+            )
+            if process.returncode != 0:
+                error: str = (process.stderr.strip().splitlines() or ["?"])[-1]
+                print(f"{backend:<12} failed: {error}")
+                continue
+            result: Dict = json.loads(process.stdout.strip().splitlines()[-1])
+            print(
+                f"{backend:<12} {result['startup']:>9.2f}s {result['pages_per_second']:>10.1f} "
+                f"{result['peak_rss_mb']:>8.1f} MB {result['rows']:>8}"
+            )
+            dfs[backend] = pd.read_pickle(output_path)
+
+    backends: List[str] = list(dfs)
+    for backend in backends[1:]:
+        print(
+            f"{backends[0]} vs {backend}: {compare_frames(dfs[backends[0]], dfs[backend])}"
+        )
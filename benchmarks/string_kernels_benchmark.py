@@ -0,0 +1,106 @@
+"""
+Micro-benchmark of the string kernels against their scalar (one value at a time) version.
+
+Usage:
+    python benchmarks/string_kernels_benchmark.py --rows 1000000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import timeit
+from typing import Callable, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from pandas import Series
+
+from database_manager import string_kernels
+
+REGEX_EMAIL = r"^[\w0-9_.+-]+@[\w-]{2,}\.[\w]{2,}[\.\w]{0,}$"
+REGEX_PHONE_NUMBER = r"[a-zA-Z\(\)\s\-\.]"
+NULL_TOKENS = ["", "NULL", "N/A"]
+
+
+def build_column(rows: int) -> Series:
+    """
+    Build a column with names, emails, phone numbers and null tokens.
+
+    * Parameters:
+        - rows: integer
+    """
+    values: List[str] = [
+        "John",
+        "Mary Jane",
+        "john.smith@example.com",
+        "mary@@example.co.uk",
+        "+44 (0)20 7946-0958",
+        "001.234.567.8901",
+        "eeEurope",
+        "NULL",
+        "N/A",
+        "GB3X9",
+    ]
+    random.seed(0)
+    return Series([random.choice(values) for _ in range(rows)], dtype=object)
+
+
+def benchmark(name: str, kernel: Callable, scalar: Callable, repeat: int) -> None:
+    """
+    * Parameters:
+        - name: string
+        - kernel: Callable -> Batched version.
+        - scalar: Callable -> One value at a time version.
+        - repeat: integer
+    """
+    kernel_time: float = min(timeit.repeat(kernel, number=1, repeat=repeat))
+    scalar_time: float = min(timeit.repeat(scalar, number=1, repeat=repeat))
+    print(
+        f"{name:<28} {kernel_time:>10.4f}s {scalar_time:>10.4f}s {scalar_time / kernel_time:>8.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    column: Series = build_column(args.rows)
+    values: List[str] = column.to_list()
+    print(f"Rows: {args.rows} | pyarrow: {string_kernels.pa is not None}")
+    print(f"{'KERNEL':<28} {'KERNEL':>11} {'SCALAR':>11} {'SPEEDUP':>9}")
+
+    benchmark(
+        "is_null_token",
+        lambda: string_kernels.is_null_token(column, NULL_TOKENS),
+        lambda: [not value or value in NULL_TOKENS for value in values],
+        args.repeat,
+    )
+    benchmark(
+        "has_digit",
+        lambda: string_kernels.has_digit(column),
+        lambda: [re.search(r"\d", value) is not None for value in values],
+        args.repeat,
+    )
+    benchmark(
+        "contains (email)",
+        lambda: string_kernels.contains(column, REGEX_EMAIL),
+        lambda: [re.search(REGEX_EMAIL, value) is not None for value in values],
+        args.repeat,
+    )
+    benchmark(
+        "strip_characters (phone)",
+        lambda: string_kernels.strip_characters(column, REGEX_PHONE_NUMBER),
+        lambda: [re.sub(REGEX_PHONE_NUMBER, "", value) for value in values],
+        args.repeat,
+    )
+    benchmark(
+        "remove_repeated_characters",
+        lambda: string_kernels.remove_repeated_characters(column),
+        lambda: [re.sub(r"((\w)\2{1,})", "", value) for value in values],
+        args.repeat,
+    )
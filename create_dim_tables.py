@@ -3,6 +3,8 @@ from database_manager.database_utils import DatabaseConnector
 from database_manager.data_extraction import DataExtractor
 
 
+from functools import partial
+
 from pandas import DataFrame
 
 from sqlalchemy import (
@@ -53,8 +55,14 @@ class CreateDimTables(DataCleaning, DatabaseConnector, DataExtractor):
         except exc.ProgrammingError as e:
             print(f"CREATING ORDERS TABLE.. :\n{e}")
             tables = self.list_db_tables()
-            df = self.read_rds_table(DatabaseConnector(), tables[-1])
-            df = self.clean_orders_data(df)
+            # The orders are read, cleaned and uploaded in chunks. Each chunk is
+            # uploaded as soon as it is cleaned, so its identifiers are not packed.
+            chunks = self.stream_rds_table(
+                DatabaseConnector(), tables[-1], columns=self._ORDERS_COLUMNS
+            )
+            dfs = self.clean_chunks(
+                chunks, partial(self.clean_orders_data, is_packed=False)
+            )
             columns_types = {
                 "date_uuid": UUID,
                 "user_uuid": UUID,
@@ -63,7 +71,9 @@ class CreateDimTables(DataCleaning, DatabaseConnector, DataExtractor):
                 "product_code": VARCHAR(length=20),
                 "product_quantity": SmallInteger,
             }
-            self.upload_to_db(df, "orders_table", column_types=columns_types)
+            self.upload_to_db(
+                dfs, "orders_table", column_types=columns_types, method="copy"
+            )
 
     @create_orders_table
     def upload_dim_users(self):
@@ -84,7 +94,7 @@ class CreateDimTables(DataCleaning, DatabaseConnector, DataExtractor):
             "date_of_birth": Date,
             "join_date": Date,
         }
-        self.upload_to_db(df, "dim_users", columns_types)
+        self.upload_to_db(df, "dim_users", columns_types, method="copy")
         # TASK 8 (MILESTONE 3)
         self.add_primary_key_on_column("dim_users", "user_uuid")
         # TASK 9 (MILESTONE 3)
@@ -202,7 +212,7 @@ class CreateDimTables(DataCleaning, DatabaseConnector, DataExtractor):
         df = self.extract_from_s3(
             "data-handling-public", "products.csv", "data/products.csv"
         )
-        df = self.convert_product_weights(df)
+        df = self.convert_product_weights(df, with_weight_class=True)
         df = self.clean_products_data(df)
         columns = [
             ["index", BIGINT],
@@ -224,9 +234,10 @@ class CreateDimTables(DataCleaning, DatabaseConnector, DataExtractor):
             using_query=True,
         )
         # TASK 4 (MILESTONE 3)
+        # The weight_class values were already computed by convert_product_weights
+        # and uploaded with the Dataframe, so add_data_into_weight_class is not needed.
         columns = [["weight_class", VARCHAR(20)]]
         self.create_new_column("dim_products", columns=columns)
-        self.add_data_into_weight_class()
         # TASK 5 (MILESTONE 3)
         df = self.extract_from_s3(
             "data-handling-public", "products.csv", "data/products.csv"
@@ -281,7 +292,7 @@ class CreateDimTables(DataCleaning, DatabaseConnector, DataExtractor):
         url = (
             "https://data-handling-public.s3.eu-west-1.amazonaws.com/date_details.json"
         )
-        df = self.extract_json_from_s3(url)
+        df = self.extract_json_from_s3(url, is_streaming=True)
         df = self.clean_date_details(df)
         columns_type = {"index": BigInteger}
         self.upload_to_db(df, table_name="dim_date_times", column_types=columns_type)
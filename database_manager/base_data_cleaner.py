@@ -1,10 +1,15 @@
+from collections import OrderedDict
 from datetime import datetime
 import re
-from typing import Union, List
+from typing import Any, Callable, Dict, Hashable, Union, List, Tuple
 import uuid
 
+import numpy as np
 import pandas as pd
-from pandas import DataFrame
+from pandas import DataFrame, Series
+
+from . import string_kernels
+from .cleaning_rules import CleaningRule, CompiledRules
 
 
 class BaseDataCleaner:
@@ -49,11 +54,17 @@ class BaseDataCleaner:
     _INDEX_USER_UUID = "user_uuid"
     _INDEX_UUID = "uuid"
     _INDEX_WEIGHT = "weight"
+    _INDEX_WEIGHT_CLASS = "weight_class"
     _INDEX_YEAR = "year"
 
     _STRING_NULL = "NULL"
     _STRING_NA = "N/A"
 
+    _WEIGHT_CLASS_LIGHT = "Light"
+    _WEIGHT_CLASS_MID_SIZED = "Mid_Sized"
+    _WEIGHT_CLASS_HEAVY = "Heavy"
+    _WEIGHT_CLASS_TRUCK_REQUIRED = "Truck_Required"
+
     __MAP_COUNTRY_CODE = {
         "DE": "Germany",
         "GB": "United Kingdom",
@@ -91,6 +102,71 @@ class BaseDataCleaner:
         "homeware",
     ]
     __TIME_PERIOD = ["Morning", "Evening", "Midday", "Late_Hours"]
+    # Known values of the enumerated columns, used as categories of their Categorical dtype.
+    __CATEGORIES = {
+        _INDEX_CARD_PROVIDER: __CARD_PROVIDERS,
+        _INDEX_CATEGORY: __PRODUCTS_CATEGORY,
+        _INDEX_CONTINENT: __CONTINENTS,
+        _INDEX_COUNTRY_CODE: list(__MAP_COUNTRY_CODE),
+        _INDEX_REMOVED: __REMOVED_ITEM,
+        _INDEX_STORE_TYPE: __STORE_TYPE,
+        _INDEX_TIME_PERIOD: __TIME_PERIOD,
+    }
+    __DATE_FORMATS = ["%Y-%m-%d", "%B %Y %d", "%Y %B %d", "%Y/%m/%d"]
+    __DATE_DEFAULT = "1900-01-01"
+
+    __REGEX_DIGIT = r"\d"
+    __REGEX_EMAIL = r"^[\w0-9_.+-]+@[\w-]{2,}\.[\w]{2,}[\.\w]{0,}$"
+    __REGEX_EMAIL_AT = r"@{2,}"
+    __REGEX_PHONE_NUMBER = r"[a-zA-Z\(\)\s\-\.]"
+    __REGEX_UUID = (
+        r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    )
+    __REGEX_STORE_CODE = r"^[A-Z]{2,3}-[A-Z0-9]{8}$"
+    __REGEX_EAN = r"\D"
+    __REGEX_PRODUCT_NAME = r"[A-Z0-9]{10}"
+    __REGEX_PRODUCT_PRICE = r"£[\d]{1,}\.[\d]{2}"
+    __REGEX_PRODUCT_CODE = r"\w{2}-\w{5,}"
+    # Weights like "1.5kg", "500g", "77ml", "100g ." or multipacks like "12 x 100g".
+    __REGEX_WEIGHT = re.compile(
+        r"^(?:(?P<multiplier>\d+) x )?(?P<quantity>\d+(?:\.\d+)?)\s?(?P<unit>[kK][gG]|[gG]|ml)(?: \.)?$"
+    )
+
+    # Declarative version of the clean_* methods, applied to the whole columns of each table.
+    _ORDERS_RULES = CompiledRules(
+        [
+            CleaningRule(_INDEX_DATE_UUID, match=__REGEX_UUID, fallback=uuid.uuid4),
+            CleaningRule(_INDEX_USER_UUID, match=__REGEX_UUID, fallback=uuid.uuid4),
+            CleaningRule(_INDEX_STORE_CODE, match=__REGEX_STORE_CODE),
+            CleaningRule(_INDEX_PRODUCT_CODE, match=__REGEX_PRODUCT_CODE),
+        ]
+    )
+    _PRODUCTS_RULES = CompiledRules(
+        [
+            CleaningRule(_INDEX_PRODUCT_NAME, reject=__REGEX_PRODUCT_NAME),
+            CleaningRule(_INDEX_PRODUCT_PRICE, match=__REGEX_PRODUCT_PRICE),
+            CleaningRule(_INDEX_UUID, match=__REGEX_UUID, fallback=uuid.uuid4),
+            CleaningRule(_INDEX_EAN, reject=__REGEX_EAN),
+            CleaningRule(_INDEX_PRODUCT_CODE, match=__REGEX_PRODUCT_CODE),
+        ]
+    )
+    _STORES_RULES = CompiledRules(
+        [
+            CleaningRule(
+                _INDEX_LOCALITY,
+                reject=__REGEX_DIGIT,
+                null_tokens=("", _STRING_NULL, _STRING_NA),
+            ),
+            CleaningRule(_INDEX_STORE_CODE, match=__REGEX_STORE_CODE),
+        ]
+    )
+    _DATE_DETAILS_RULES = CompiledRules(
+        [CleaningRule(_INDEX_DATE_UUID, match=__REGEX_UUID, fallback=uuid.uuid4)]
+    )
+
+    # Cleaned values of the low cardinality columns, shared by all the cleaner instances.
+    _MEMO_CACHE_SIZE: int = 4096
+    __memo_cache: "OrderedDict[Tuple[str, type, Hashable], Any]" = OrderedDict()
 
     def clean_strings(self, string: str) -> Union[str, None]:
         """
@@ -112,24 +188,6 @@ class BaseDataCleaner:
             string = None
         return string
 
-    def __check_date_format(self, date: str, format: str) -> bool:
-        """
-        Check if the date string is in date format.
-
-        * Parameters:
-            - date: string
-            - format: string -> Pattern of date
-        """
-        is_format: bool = True
-        try:
-            is_format = bool(datetime.strptime(date, format))
-        except ValueError:
-            is_format = False
-        except TypeError:
-            is_format = False
-
-        return is_format
-
     def clean_date(self, date: str) -> datetime:
         """
         Convert datetime fields to %Y-%m-%d format. Otherwise,  or None.
@@ -137,16 +195,13 @@ class BaseDataCleaner:
         * Parameters:
             - date: string
         """
-        if self.__check_date_format(date, "%Y-%m-%d"):
-            return pd.to_datetime(date).date()
-        elif (
-            self.__check_date_format(date, "%B %Y %d")
-            or self.__check_date_format(date, "%Y %B %d")
-            or self.__check_date_format(date, "%Y/%m/%d")
-        ):
-            return pd.to_datetime(date).date()
-        else:
-            return pd.to_datetime("1900-01-01").date()
+        for date_format in self.__DATE_FORMATS:
+            try:
+                return datetime.strptime(date, date_format).date()
+            except (ValueError, TypeError):
+                continue
+
+        return pd.to_datetime(self.__DATE_DEFAULT).date()
 
     def clean_continent(self, continent: str) -> Union[str, None]:
         """
@@ -172,10 +227,10 @@ class BaseDataCleaner:
         * Parameters:
             - email: string
         """
-        regex: str = r"^[\w0-9_.+-]+@[\w-]{2,}\.[\w]{2,}[\.\w]{0,}$"
+        regex: str = self.__REGEX_EMAIL
         new_email: str = email
         if re.search(regex, email) is None:
-            at_regex = r"@{2,}"
+            at_regex = self.__REGEX_EMAIL_AT
             if re.search(at_regex, email):
                 new_email = re.sub(at_regex, "@", email)
             elif re.search(r"[^@]", email):
@@ -237,7 +292,7 @@ class BaseDataCleaner:
         if phone_number == self._STRING_NULL:
             new_phone_number = None
         elif re.search(regex, phone_number) is not None:
-            new_phone_number = re.sub(r"[a-zA-Z\(\)\s\-\.]", "", phone_number)
+            new_phone_number = re.sub(self.__REGEX_PHONE_NUMBER, "", phone_number)
 
         return new_phone_number
 
@@ -249,7 +304,7 @@ class BaseDataCleaner:
             - uuid: str|uuid
         """
         new_uuid: str = uuid_code
-        regex = r"\w{8}-\w{4}-\w{4}-\w{4}-\w{12}"
+        regex = self.__REGEX_UUID
         try:
             if re.search(regex, new_uuid) is None:
                 new_uuid = uuid.uuid4()
@@ -334,7 +389,7 @@ class BaseDataCleaner:
             - store_code: string
         """
         new_store_code: str = store_code
-        regex_store_code = r"^([A-Z]{2,3}-[A-Z0-9]{8})$"
+        regex_store_code = self.__REGEX_STORE_CODE
         if re.search(regex_store_code, new_store_code) is None:
             new_store_code = None
         return new_store_code
@@ -413,7 +468,7 @@ class BaseDataCleaner:
             - ean: string|integer
         """
         new_ean: str = ean
-        regex = r"\D"
+        regex = self.__REGEX_EAN
         try:
             if re.search(regex, ean):
                 new_ean = None
@@ -429,7 +484,7 @@ class BaseDataCleaner:
             - product_name: string
         """
         new_product_name: str = product_name
-        regex = r"[A-Z0-9]{10}"
+        regex = self.__REGEX_PRODUCT_NAME
         try:
             if re.search(regex, product_name):
                 new_product_name = None
@@ -448,7 +503,7 @@ class BaseDataCleaner:
             - product_price: string
         """
         new_product_price: str = product_price
-        regex = r"£[\d]{1,}\.[\d]{2}"
+        regex = self.__REGEX_PRODUCT_PRICE
         try:
             if re.search(regex, product_price) is None:
                 new_product_price = None
@@ -470,7 +525,7 @@ class BaseDataCleaner:
             - product_code: string
         """
         new_product_code: str = product_code
-        regex = r"\w{2}-\w{5,}"
+        regex = self.__REGEX_PRODUCT_CODE
         try:
             if re.search(regex, product_code) is None:
                 new_product_code = None
@@ -582,3 +637,316 @@ class BaseDataCleaner:
             new_df: DataFrame = df.copy()
 
         return new_df
+
+    def _is_null_token(self, column: Series) -> Series:
+        """
+        Column version of the empty, NULL and N/A checks done by clean_strings_with_numbers.
+
+        * Parameters:
+            - column: Series
+        """
+        return string_kernels.is_null_token(
+            column, ["", self._STRING_NULL, self._STRING_NA]
+        )
+
+    def clean_strings_column(self, column: Series) -> Series:
+        """
+        Column version of clean_strings.
+
+        * Parameters:
+            - column: Series
+        """
+        has_digit: Series = string_kernels.has_digit(column)
+        return column.mask(self._is_null_token(column) | has_digit, None)
+
+    def clean_strings_with_numbers_column(self, column: Series) -> Series:
+        """
+        Column version of clean_strings_with_numbers.
+
+        * Parameters:
+            - column: Series
+        """
+        return column.mask(self._is_null_token(column), None)
+
+    def parse_dates(self, column: Series) -> Tuple[Series, Dict[str, int]]:
+        """
+        Parse a whole column of dates. Duplicated raw values are parsed just one time and
+        each known date format is tried in one pass over the values that are still unparsed.
+        Values that do not match any format (or are not strings) receive the 1900-01-01 date.
+
+        Returns the parsed dates and the number of rows found for each format.
+
+        * Parameters:
+            - column: Series
+        """
+        codes, uniques = pd.factorize(column)
+        raw_dates: Series = Series(uniques, dtype=object)
+        dates: Series = Series(pd.NaT, index=raw_dates.index, dtype="datetime64[ns]")
+        is_string: Series = string_kernels.is_string(raw_dates)
+        # Number of rows sharing each unique raw value.
+        rows_by_date: np.ndarray = np.bincount(
+            codes[codes >= 0], minlength=len(raw_dates)
+        )
+
+        format_hits: Dict[str, int] = {}
+        for date_format in self.__DATE_FORMATS:
+            unparsed: Series = dates.isna() & is_string
+            if unparsed.any():
+                dates[unparsed] = pd.to_datetime(
+                    raw_dates[unparsed], format=date_format, errors="coerce"
+                )
+            is_hit: np.ndarray = (unparsed & dates.notna()).to_numpy()
+            format_hits[date_format] = int(rows_by_date[is_hit].sum())
+
+        date_default = pd.Timestamp(self.__DATE_DEFAULT).date()
+        # The null values have code -1, which picks the default date appended at the end.
+        parsed_dates: np.ndarray = np.append(
+            dates.fillna(pd.Timestamp(self.__DATE_DEFAULT)).dt.date.to_numpy(),
+            date_default,
+        )
+
+        # Dates out of the range of pd.Timestamp ("0001-01-01") are parsed one by one,
+        # as clean_date does.
+        is_default: np.ndarray = dates.isna().to_numpy()
+        for position in np.flatnonzero(is_default & is_string.to_numpy()):
+            for date_format in self.__DATE_FORMATS:
+                try:
+                    parsed_dates[position] = datetime.strptime(
+                        raw_dates[position], date_format
+                    ).date()
+                except ValueError:
+                    continue
+                is_default[position] = False
+                format_hits[date_format] += int(rows_by_date[position])
+                break
+
+        format_hits[self.__DATE_DEFAULT] = int(rows_by_date[is_default].sum()) + int(
+            (codes < 0).sum()
+        )
+        return (
+            Series(parsed_dates[codes], index=column.index, dtype=object),
+            format_hits,
+        )
+
+    def clean_date_column(self, column: Series) -> Series:
+        """
+        Column version of clean_date. The number of rows found for each date format is printed.
+
+        * Parameters:
+            - column: Series
+        """
+        dates, format_hits = self.parse_dates(column)
+        print(f"Date formats found in '{column.name}': {format_hits}")
+        return dates
+
+    def clean_email_column(self, column: Series) -> Series:
+        """
+        Column version of clean_email.
+
+        * Parameters:
+            - column: Series
+        """
+        is_valid: Series = string_kernels.contains(column, self.__REGEX_EMAIL)
+        has_many_at: Series = string_kernels.contains(column, self.__REGEX_EMAIL_AT)
+        has_not_at: Series = string_kernels.contains(column, r"[^@]")
+
+        fixed_at: Series = string_kernels.replace(column, self.__REGEX_EMAIL_AT, "@")
+        new_column: Series = column.mask(~is_valid & has_many_at, fixed_at)
+        return new_column.mask(~is_valid & ~has_many_at & has_not_at, None)
+
+    def clean_country_column(self, country: Series, country_code: Series) -> Series:
+        """
+        Column version of clean_country.
+
+        * Parameters:
+            - country: Series
+            - country_code: Series
+        """
+        mapped_country: Series = country_code.map(self.__MAP_COUNTRY_CODE)
+        new_country: Series = country.mask(
+            mapped_country.notna() & ~country.isin(self.__COUNTRIES), mapped_country
+        )
+        is_invalid: Series = (country == self._STRING_NULL) | string_kernels.has_digit(
+            country
+        )
+        return new_country.mask(is_invalid, None)
+
+    def clean_country_code_column(self, country_code: Series) -> Series:
+        """
+        Column version of clean_country_code.
+
+        * Parameters:
+            - country_code: Series
+        """
+        return country_code.where(country_code.isin(self.__MAP_COUNTRY_CODE), None)
+
+    def clean_phone_number_column(self, column: Series) -> Series:
+        """
+        Column version of clean_phone_number.
+
+        * Parameters:
+            - column: Series
+        """
+        new_column: Series = string_kernels.strip_characters(
+            column, self.__REGEX_PHONE_NUMBER
+        )
+        return new_column.mask(column == self._STRING_NULL, None)
+
+    def clean_continent_column(self, column: Series) -> Series:
+        """
+        Column version of clean_continent. Values that are not strings become None.
+
+        * Parameters:
+            - column: Series
+        """
+        is_valid: Series = column.isin(self.__CONTINENTS)
+        has_repeated: Series = string_kernels.has_repeated_characters(column)
+        cleaned: Series = string_kernels.remove_repeated_characters(column)
+        return column.mask(~is_valid & has_repeated, cleaned).mask(
+            ~is_valid & ~has_repeated, None
+        )
+
+    def clean_uuid_column(self, column: Series) -> Series:
+        """
+        Column version of clean_uuid. A new random uuid is generated for each invalid value.
+
+        * Parameters:
+            - column: Series
+        """
+        is_valid: Series = string_kernels.contains(column, self.__REGEX_UUID)
+        new_uuids: Series = Series(
+            [uuid.uuid4() for _ in range((~is_valid).sum())],
+            index=column.index[~is_valid],
+            dtype=object,
+        )
+        return column.mask(~is_valid, new_uuids)
+
+    def _clean_value_memoized(
+        self, clean_function: Callable[[Any], Any], value: Hashable
+    ) -> Any:
+        """
+        Return the cleaned value from the LRU cache, cleaning it only on a cache miss.
+
+        * Parameters:
+            - clean_function: Callable -> One of the clean_* methods with a single parameter.
+            - value: Hashable
+        """
+        key: Tuple[str, type, Hashable] = (
+            clean_function.__name__,
+            type(value),
+            value,
+        )
+        if key in self.__memo_cache:
+            self.__memo_cache.move_to_end(key)
+            return self.__memo_cache[key]
+
+        cleaned_value: Any = clean_function(value)
+        self.__memo_cache[key] = cleaned_value
+        if len(self.__memo_cache) > self._MEMO_CACHE_SIZE:
+            self.__memo_cache.popitem(last=False)
+        return cleaned_value
+
+    def to_categorical(self, column: Series) -> Series:
+        """
+        Convert an enumerated column (store_type, country_code, continent, category,
+        card_provider, time_period or removed) to the Categorical dtype, with its known values
+        as categories. Unexpected cleaned values are added at the end of the categories.
+
+        * Parameters:
+            - column: Series
+        """
+        categories: List[str] = list(self.__CATEGORIES[column.name])
+        for value in column.dropna().unique():
+            if value not in categories:
+                categories.append(value)
+
+        return column.astype(pd.CategoricalDtype(categories=categories))
+
+    def clean_column_memoized(
+        self, column: Series, clean_function: Callable[[Any], Any]
+    ) -> Series:
+        """
+        Clean a low cardinality column (country_code, store_type, category, etc).
+        The column is factorized, so clean_function runs only for the unique values
+        that are not cached yet, and the results are mapped back by code.
+
+        * Parameters:
+            - column: Series
+            - clean_function: Callable -> One of the clean_* methods with a single parameter.
+        """
+        codes, uniques = pd.factorize(column, use_na_sentinel=False)
+        cleaned_uniques: np.ndarray = np.empty(len(uniques), dtype=object)
+        for code, value in enumerate(uniques):
+            cleaned_uniques[code] = self._clean_value_memoized(clean_function, value)
+        return Series(
+            cleaned_uniques[codes], index=column.index, dtype=object, name=column.name
+        )
+
+    def parse_weights(self, column: Series) -> Tuple[Series, Series]:
+        """
+        Column version of clean_weight. The multiplier, quantity and unit are extracted
+        from the whole column with one regular expression and converted to KG with numpy.
+        Values that do not have a known pattern are cleaned with clean_weight.
+
+        Returns the weights in KG and their weight class:
+            +--------------------------+-------------------+
+            | weight_class             | weight range(kg)  |
+            +--------------------------+-------------------+
+            | Light                    | < 2               |
+            | Mid_Sized                | >= 2 - < 40       |
+            | Heavy                    | >= 40 - < 140     |
+            | Truck_Required           | => 140            |
+            +----------------------------+-----------------+
+
+        * Parameters:
+            - column: Series
+        """
+        is_string: Series = string_kernels.is_string(column)
+        # The column can be float (all the weights of a partition are missing).
+        parts: DataFrame = (
+            column[is_string].astype(object).str.extract(self.__REGEX_WEIGHT)
+        )
+        parts = parts.reindex(column.index)
+
+        is_kg: Series = parts["unit"].str.lower() == "kg"
+        has_multiplier: Series = parts["multiplier"].notna()
+        # Multipacks in KG or with decimal quantities keep the behaviour of clean_weight.
+        is_parsed: Series = parts["quantity"].notna() & ~(
+            has_multiplier
+            & (is_kg | parts["quantity"].str.contains(".", regex=False, na=False))
+        )
+
+        quantity: np.ndarray = pd.to_numeric(parts["quantity"][is_parsed]).to_numpy(
+            dtype=float
+        )
+        multiplier: np.ndarray = (
+            pd.to_numeric(parts["multiplier"][is_parsed])
+            .fillna(1)
+            .to_numpy(dtype=float)
+        )
+        kilos: np.ndarray = quantity * multiplier
+        kilos = np.where(is_kg[is_parsed].to_numpy(), kilos, kilos / 1000)
+
+        weights: Series = Series(
+            np.empty(len(column), dtype=object), index=column.index
+        )
+        weights[is_parsed] = kilos
+        weights[~is_parsed] = self.clean_column_memoized(
+            column[~is_parsed], self.clean_weight
+        )
+
+        numeric_weights: Series = pd.to_numeric(weights, errors="coerce")
+        weight_classes: Series = Series(
+            np.select(
+                [numeric_weights >= 140, numeric_weights >= 40, numeric_weights >= 2],
+                [
+                    self._WEIGHT_CLASS_TRUCK_REQUIRED,
+                    self._WEIGHT_CLASS_HEAVY,
+                    self._WEIGHT_CLASS_MID_SIZED,
+                ],
+                default=self._WEIGHT_CLASS_LIGHT,
+            ),
+            index=column.index,
+            dtype=object,
+        )
+        return weights, weight_classes
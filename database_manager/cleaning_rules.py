@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+import re
+from typing import Any, Callable, List, Pattern, Tuple, Union
+
+from pandas import DataFrame, Series
+
+from . import string_kernels
+
+
+@dataclass(frozen=True)
+class CleaningRule:
+    """
+    Declarative cleaning rule of one column.
+
+    * Attributes:
+        - column: string
+        - match: string -> Regular expression. Values that do not match it are invalid.
+        - reject: string -> Regular expression. Values that match it are invalid.
+        - replace: (string, string) -> Regular expression and replacement applied before the match and reject checks.
+        - null_tokens: tuple -> Values converted to None, like "NULL" or "N/A".
+        - fallback: Callable -> Called for each invalid value (uuid.uuid4, for instance). If it is None, invalid values are converted to None.
+
+    Values that are not strings are invalid.
+    """
+
+    column: str
+    match: str = None
+    reject: str = None
+    replace: Tuple[str, str] = None
+    null_tokens: Tuple[str, ...] = ()
+    fallback: Callable[[], Any] = None
+
+
+class CompiledRules:
+    """
+    Precompiled cleaning rules of a table. All the rules are applied to the whole
+    columns in one call of apply, without iterating over the rows.
+    """
+
+    def __init__(self, rules: List[CleaningRule]):
+        self.rules: List[CleaningRule] = rules
+        self.__compiled: List[
+            Tuple[
+                CleaningRule,
+                Union[Pattern, None],
+                Union[Pattern, None],
+                Union[Pattern, None],
+            ]
+        ] = [
+            (
+                rule,
+                re.compile(rule.match) if rule.match else None,
+                re.compile(rule.reject) if rule.reject else None,
+                re.compile(rule.replace[0]) if rule.replace else None,
+            )
+            for rule in rules
+        ]
+
+    @property
+    def columns(self) -> List[str]:
+        """
+        Columns cleaned by the rules.
+        """
+        return [rule.column for rule in self.rules]
+
+    def apply(self, df: DataFrame) -> DataFrame:
+        """
+        Clean all the columns of the Dataframe that have a rule.
+
+        * Parameters:
+            - df: Dataframe
+        """
+        for rule, match, reject, replace in self.__compiled:
+            df[rule.column] = self.__apply_rule(
+                df[rule.column], rule, match, reject, replace
+            )
+        return df
+
+    def __apply_rule(
+        self,
+        column: Series,
+        rule: CleaningRule,
+        match: Union[Pattern, None],
+        reject: Union[Pattern, None],
+        replace: Union[Pattern, None],
+    ) -> Series:
+        """
+        * Parameters:
+            - column: Series
+            - rule: CleaningRule
+            - match: Pattern
+            - reject: Pattern
+            - replace: Pattern
+        """
+        is_string: Series = string_kernels.is_string(column)
+        values: Series = column.astype(object).where(is_string)
+        is_null: Series = values.isin(rule.null_tokens)
+
+        if replace is not None:
+            values = string_kernels.replace(values, replace, rule.replace[1])
+
+        is_valid: Series = is_string & ~is_null
+        if match is not None:
+            is_valid &= string_kernels.contains(values, match)
+        if reject is not None:
+            is_valid &= ~string_kernels.contains(values, reject)
+
+        new_column: Series = values.where(is_valid, None)
+        is_invalid: Series = ~is_valid & ~is_null
+        if rule.fallback is not None and is_invalid.any():
+            new_column[is_invalid] = Series(
+                [rule.fallback() for _ in range(is_invalid.sum())],
+                index=column.index[is_invalid],
+                dtype=object,
+            )
+        return new_column
@@ -1,21 +1,129 @@
 from .data_extraction import DataExtractor
 from .database_utils import DatabaseConnector
 from .base_data_cleaner import BaseDataCleaner
+from . import identifiers
+from .row_filters import RangeFilter
 
-from pandas import DataFrame
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import math
+from typing import Callable, Iterable, Iterator, List, Sequence, Tuple, Union
+
+import pandas as pd
+from pandas import DataFrame, Series
+from pandas.api.types import union_categoricals
 
 
 class DataCleaning(BaseDataCleaner, DatabaseConnector):
 
-    def clean_user_data(self, table_name: str) -> DataFrame:
+    # Columns read from the RDS tables by each clean_*_data method. The other columns
+    # are never transferred.
+    _USER_COLUMNS: List[str] = [
+        BaseDataCleaner._INDEX,
+        BaseDataCleaner._INDEX_FIRST_NAME,
+        BaseDataCleaner._INDEX_LAST_NAME,
+        BaseDataCleaner._INDEX_DATE_OF_BIRTH,
+        BaseDataCleaner._INDEX_COMPANY,
+        BaseDataCleaner._INDEX_EMAIL_ADDRESS,
+        BaseDataCleaner._INDEX_ADDRESS,
+        BaseDataCleaner._INDEX_COUNTRY,
+        BaseDataCleaner._INDEX_COUNTRY_CODE,
+        BaseDataCleaner._INDEX_PHONE_NUMBER,
+        BaseDataCleaner._INDEX_JOIN_DATE,
+        BaseDataCleaner._INDEX_USER_UUID,
+    ]
+    _ORDERS_COLUMNS: List[str] = [
+        BaseDataCleaner._INDEX,
+        BaseDataCleaner._INDEX_DATE_UUID,
+        BaseDataCleaner._INDEX_USER_UUID,
+        BaseDataCleaner._INDEX_CARD_NUMBER,
+        BaseDataCleaner._INDEX_STORE_CODE,
+        BaseDataCleaner._INDEX_PRODUCT_CODE,
+        BaseDataCleaner._INDEX_PRODUCT_QUANTITY,
+    ]
+
+    def clean_user_data(
+        self,
+        table_name: str,
+        is_vectorized: bool = True,
+        workers: int = 1,
+        partition_size: int = None,
+        filters: Sequence[RangeFilter] = (),
+        is_packed: bool = True,
+    ) -> DataFrame:
         """
         Clean the user data.
+        Only the _USER_COLUMNS (and the rows of the filters) are read from the table.
 
         * Parameters:
-            - df: Dataframe
+            - table_name: string
+            - is_vectorized: boolean -> If this option is False, the data will be cleaned row by row.
+            - workers: integer -> Number of processes. The data is cleaned in parallel if it is greater than 1.
+            - partition_size: integer -> Number of rows of each partition cleaned in parallel.
+            - filters: List of RangeFilter -> Key range or watermark of the rows.
+            - is_packed: boolean -> If this option is False, the identifiers are not packed (see pack_identifiers).
         """
         data_extractor: DataExtractor = DataExtractor()
-        df: DataFrame = data_extractor.read_rds_table(DatabaseConnector(), table_name)
+        df: DataFrame = data_extractor.read_rds_table(
+            DatabaseConnector(), table_name, self._USER_COLUMNS, filters
+        )
+        if is_vectorized:
+            clean_rows = self._clean_user_data_by_column
+        else:
+            clean_rows = self._clean_user_data_by_row
+        df = self._clean_partitions(df, clean_rows, workers, partition_size)
+
+        df = df.convert_dtypes()
+        if is_packed:
+            df = self.pack_identifiers(df)
+
+        return df
+
+    def _clean_user_data_by_column(self, df: DataFrame) -> DataFrame:
+        """
+        Clean the user data applying each rule to the whole column at once.
+
+        * Parameters:
+            - df: Dataframe
+        """
+        country: Series = df[self._INDEX_COUNTRY]
+        country_code: Series = df[self._INDEX_COUNTRY_CODE]
+
+        df[self._INDEX_FIRST_NAME] = self.clean_strings_column(
+            df[self._INDEX_FIRST_NAME]
+        )
+        df[self._INDEX_LAST_NAME] = self.clean_strings_column(df[self._INDEX_LAST_NAME])
+        df[self._INDEX_COMPANY] = self.clean_strings_with_numbers_column(
+            df[self._INDEX_COMPANY]
+        )
+        df[self._INDEX_ADDRESS] = self.clean_strings_with_numbers_column(
+            df[self._INDEX_ADDRESS]
+        )
+        df[self._INDEX_DATE_OF_BIRTH] = self.clean_date_column(
+            df[self._INDEX_DATE_OF_BIRTH]
+        )
+        df[self._INDEX_JOIN_DATE] = self.clean_date_column(df[self._INDEX_JOIN_DATE])
+        df[self._INDEX_EMAIL_ADDRESS] = self.clean_email_column(
+            df[self._INDEX_EMAIL_ADDRESS]
+        )
+        df[self._INDEX_COUNTRY] = self.clean_country_column(country, country_code)
+        df[self._INDEX_COUNTRY_CODE] = self.to_categorical(
+            self.clean_country_code_column(country_code)
+        )
+        df[self._INDEX_PHONE_NUMBER] = self.clean_phone_number_column(
+            df[self._INDEX_PHONE_NUMBER]
+        )
+        df[self._INDEX_USER_UUID] = self.clean_uuid_column(df[self._INDEX_USER_UUID])
+
+        return df
+
+    def _clean_user_data_by_row(self, df: DataFrame) -> DataFrame:
+        """
+        Clean the user data row by row.
+
+        * Parameters:
+            - df: Dataframe
+        """
         for index, row in df.iterrows():
             df.at[index, self._INDEX_FIRST_NAME] = self.clean_strings(
                 row[self._INDEX_FIRST_NAME]
@@ -50,19 +158,51 @@ class DataCleaning(BaseDataCleaner, DatabaseConnector):
             df.at[index, self._INDEX_USER_UUID] = self.clean_uuid(
                 row[self._INDEX_USER_UUID]
             )
-
-        df = df.convert_dtypes()
+        df[self._INDEX_COUNTRY_CODE] = self.to_categorical(df[self._INDEX_COUNTRY_CODE])
 
         return df
 
-    def clean_card_data(self, df: DataFrame) -> DataFrame:
+    def clean_card_data(
+        self,
+        df: DataFrame,
+        with_rejected: bool = False,
+        workers: int = 1,
+        partition_size: int = None,
+        is_packed: bool = True,
+    ) -> Union[DataFrame, Tuple[DataFrame, DataFrame]]:
         """
         Clean the card data.
 
         * Parameters:
             - df: Dataframe
+            - with_rejected: boolean -> If this option is True, the rows without a valid card number are returned as a second Dataframe.
+            - workers: integer -> Number of processes. The data is cleaned in parallel if it is greater than 1.
+            - partition_size: integer -> Number of rows of each partition cleaned in parallel.
+            - is_packed: boolean -> If this option is False, the identifiers are not packed (see pack_identifiers).
+        """
+        raw_card_numbers: Series = df[self._INDEX_CARD_NUMBER].copy()
+        df = self._clean_partitions(df, self._clean_card_rows, workers, partition_size)
+        df, df_rejected = self.__drop_rejected_rows(
+            df, self._INDEX_CARD_NUMBER, raw_card_numbers
+        )
+        df = df.convert_dtypes()
+        df[self._INDEX_DATE_PAYMENT_CONFIRMED] = df[
+            self._INDEX_DATE_PAYMENT_CONFIRMED
+        ].astype("datetime64[ns]")
+        if is_packed:
+            df = self.pack_identifiers(df)
+
+        if with_rejected:
+            return df, df_rejected
+        return df
+
+    def _clean_card_rows(self, df: DataFrame) -> DataFrame:
         """
+        Clean the columns of the card data.
 
+        * Parameters:
+            - df: Dataframe
+        """
         for index, row in df.iterrows():
             df.at[index, self._INDEX_CARD_NUMBER] = self.clean_integer_number(
                 row[self._INDEX_CARD_NUMBER]
@@ -70,35 +210,55 @@ class DataCleaning(BaseDataCleaner, DatabaseConnector):
             df.at[index, self._INDEX_EXPIRY_DATE] = self.clean_expiry_date(
                 row[self._INDEX_EXPIRY_DATE]
             )
-            # Check if the card provider is not in the valid card providers listed names.
-            df.at[index, self._INDEX_CARD_PROVIDER] = self.clean_card_provider(
-                row[self._INDEX_CARD_PROVIDER]
-            )
-            # If there is error in the date pattern, try to convert the date in right format (YYYY-mm-dd) or asign None.
-            df.at[index, self._INDEX_DATE_PAYMENT_CONFIRMED] = self.clean_date(
-                row[self._INDEX_DATE_PAYMENT_CONFIRMED]
-            )
-            # print(df.columns.to_list())
-            if df.at[index, self._INDEX_CARD_NUMBER] is None:
-                df.drop(index, inplace=True)
 
-        df = df.convert_dtypes()
-        df[self._INDEX_DATE_PAYMENT_CONFIRMED] = df[
-            self._INDEX_DATE_PAYMENT_CONFIRMED
-        ].astype("datetime64[ns]")
+        # Check if the card provider is not in the valid card providers listed names.
+        df[self._INDEX_CARD_PROVIDER] = self.to_categorical(
+            self.clean_column_memoized(
+                df[self._INDEX_CARD_PROVIDER], self.clean_card_provider
+            )
+        )
+        # If there is error in the date pattern, try to convert the date in right format (YYYY-mm-dd) or asign None.
+        df[self._INDEX_DATE_PAYMENT_CONFIRMED] = self.clean_date_column(
+            df[self._INDEX_DATE_PAYMENT_CONFIRMED]
+        )
 
         return df
 
-    def clean_store_data(self, df: DataFrame) -> DataFrame:
+    def clean_store_data(
+        self,
+        df: DataFrame,
+        with_rejected: bool = False,
+        workers: int = 1,
+        partition_size: int = None,
+    ) -> Union[DataFrame, Tuple[DataFrame, DataFrame]]:
         """
         Clean the store data.
 
         * Parameters:
             - df: Dataframe
+            - with_rejected: boolean -> If this option is True, the rows without a valid store code are returned as a second Dataframe.
+            - workers: integer -> Number of processes. The data is cleaned in parallel if it is greater than 1.
+            - partition_size: integer -> Number of rows of each partition cleaned in parallel.
         """
         df = df.drop(columns=[self._INDEX_LAT])
         df = self.sort_store_columns(df)
+        raw_store_codes: Series = df[self._INDEX_STORE_CODE].copy()
+        df = self._clean_partitions(df, self._clean_store_rows, workers, partition_size)
+        df, df_rejected = self.__drop_rejected_rows(
+            df, self._INDEX_STORE_CODE, raw_store_codes
+        )
+
+        if with_rejected:
+            return df, df_rejected
+        return df
+
+    def _clean_store_rows(self, df: DataFrame) -> DataFrame:
+        """
+        Clean the columns of the store data.
 
+        * Parameters:
+            - df: Dataframe
+        """
         for index, row in df.iterrows():
             df.at[index, self._INDEX_STAFF_NUMBERS] = self.clean_integer_number(
                 row[self._INDEX_STAFF_NUMBERS], min_digits=1
@@ -106,139 +266,318 @@ class DataCleaning(BaseDataCleaner, DatabaseConnector):
             df.at[index, self._INDEX_ADDRESS] = self.clean_strings_with_numbers(
                 row[self._INDEX_ADDRESS]
             )
-            df.at[index, self._INDEX_LOCALITY] = self.clean_strings(
-                row[self._INDEX_LOCALITY]
-            )
-            df.at[index, self._INDEX_STORE_TYPE] = self.clean_store_type(
-                row[self._INDEX_STORE_TYPE]
-            )
-            df.at[index, self._INDEX_COUNTRY_CODE] = self.clean_country_code(
-                country_code=row[self._INDEX_COUNTRY_CODE]
-            )
             df.at[index, self._INDEX_LONGITUDE] = self.clean_float_number(
                 row[self._INDEX_LONGITUDE]
             )
             df.at[index, self._INDEX_LATITUDE] = self.clean_float_number(
                 row[self._INDEX_LATITUDE]
             )
-            df.at[index, self._INDEX_STORE_CODE] = self.clean_store_code(
-                row[self._INDEX_STORE_CODE]
-            )
-            df.at[index, self._INDEX_OPENING_DATE] = self.clean_date(
-                row[self._INDEX_OPENING_DATE]
-            )
-            df.at[index, self._INDEX_CONTINENT] = self.clean_continent(
-                row[self._INDEX_CONTINENT]
-            )
             # if df.at[index, self._INDEX_STAFF_NUMBERS] is None:
             #     print(
             #         f"The index {row[self._INDEX]} has {row[self._INDEX_STAFF_NUMBERS]}"
             #     )
-            if df.at[index, self._INDEX_STORE_CODE] is None:
-                print(f"The row with index {row[self._INDEX]} will be deleted!")
-                df.drop(index, inplace=True)
+
+        df = self._STORES_RULES.apply(df)
+        df[self._INDEX_STORE_TYPE] = self.to_categorical(
+            self.clean_column_memoized(
+                df[self._INDEX_STORE_TYPE], self.clean_store_type
+            )
+        )
+        df[self._INDEX_COUNTRY_CODE] = self.to_categorical(
+            self.clean_country_code_column(df[self._INDEX_COUNTRY_CODE])
+        )
+        df[self._INDEX_OPENING_DATE] = self.clean_date_column(
+            df[self._INDEX_OPENING_DATE]
+        )
+        df[self._INDEX_CONTINENT] = self.to_categorical(
+            self.clean_continent_column(df[self._INDEX_CONTINENT])
+        )
 
         return df
 
-    def convert_product_weights(self, df: DataFrame) -> DataFrame:
+    def convert_product_weights(
+        self,
+        df: DataFrame,
+        with_weight_class: bool = False,
+        workers: int = 1,
+        partition_size: int = None,
+    ) -> DataFrame:
         """
         Convert all the weights to a KG.
 
         * Parameters:
             - df: Dataframe
+            - with_weight_class: boolean -> If this option is True, the weight_class column is added to the Dataframe.
+            - workers: integer -> Number of processes. The data is cleaned in parallel if it is greater than 1.
+            - partition_size: integer -> Number of rows of each partition cleaned in parallel.
         """
-        for index, row in df.iterrows():
-            df.at[index, self._INDEX_WEIGHT] = self.clean_weight(
-                row[self._INDEX_WEIGHT]
-            )
+        convert_rows = partial(
+            self._convert_product_weight_rows, with_weight_class=with_weight_class
+        )
+        return self._clean_partitions(df, convert_rows, workers, partition_size)
+
+    def _convert_product_weight_rows(
+        self, df: DataFrame, with_weight_class: bool = False
+    ) -> DataFrame:
+        """
+        Convert the weights of the products data to KG.
+
+        * Parameters:
+            - df: Dataframe
+            - with_weight_class: boolean
+        """
+        weights, weight_classes = self.parse_weights(df[self._INDEX_WEIGHT])
+        df[self._INDEX_WEIGHT] = weights
+        if with_weight_class:
+            df[self._INDEX_WEIGHT_CLASS] = weight_classes
 
         return df
 
-    def clean_products_data(self, df: DataFrame) -> DataFrame:
+    def clean_products_data(
+        self,
+        df: DataFrame,
+        with_rejected: bool = False,
+        workers: int = 1,
+        partition_size: int = None,
+        is_packed: bool = True,
+    ) -> Union[DataFrame, Tuple[DataFrame, DataFrame]]:
         """
         Clean the products data.
 
         * Parameters:
             - df: Dataframe
+            - with_rejected: boolean -> If this option is True, the rows without a valid product code are returned as a second Dataframe.
+            - workers: integer -> Number of processes. The data is cleaned in parallel if it is greater than 1.
+            - partition_size: integer -> Number of rows of each partition cleaned in parallel.
+            - is_packed: boolean -> If this option is False, the identifiers are not packed (see pack_identifiers).
         """
         df.rename(columns={"EAN": "ean"}, inplace=True)
         df.reset_index(inplace=True)
-        for index, row in df.iterrows():
-            df.at[index, self._INDEX_PRODUCT_NAME] = self.clean_product_name(
-                row[self._INDEX_PRODUCT_NAME]
-            )
-            df.at[index, self._INDEX_PRODUCT_PRICE] = self.clean_product_price(
-                row[self._INDEX_PRODUCT_PRICE]
-            )
-            df.at[index, self._INDEX_DATE_ADDED] = self.clean_date(
-                row[self._INDEX_DATE_ADDED]
-            )
-            df.at[index, self._INDEX_UUID] = self.clean_uuid(row[self._INDEX_UUID])
-            df.at[index, self._INDEX_REMOVED] = self.clean_removed(
-                row[self._INDEX_REMOVED]
-            )
-            df.at[index, self._INDEX_CATEGORY] = self.clean_product_category(
-                row[self._INDEX_CATEGORY]
-            )
-            df.at[index, self._INDEX_EAN] = self.clean_ean(row[self._INDEX_EAN])
-            df.at[index, self._INDEX_PRODUCT_CODE] = self.clean_product_code(
-                row[self._INDEX_PRODUCT_CODE]
+        raw_product_codes: Series = df[self._INDEX_PRODUCT_CODE].copy()
+        df = self._clean_partitions(
+            df, self._clean_products_rows, workers, partition_size
+        )
+        df, df_rejected = self.__drop_rejected_rows(
+            df, self._INDEX_PRODUCT_CODE, raw_product_codes
+        )
+        if is_packed:
+            df = self.pack_identifiers(df)
+
+        if with_rejected:
+            return df, df_rejected
+        return df
+
+    def _clean_products_rows(self, df: DataFrame) -> DataFrame:
+        """
+        Clean the columns of the products data.
+
+        * Parameters:
+            - df: Dataframe
+        """
+        df = self._PRODUCTS_RULES.apply(df)
+        df[self._INDEX_DATE_ADDED] = self.clean_date_column(df[self._INDEX_DATE_ADDED])
+        df[self._INDEX_REMOVED] = self.to_categorical(
+            self.clean_column_memoized(df[self._INDEX_REMOVED], self.clean_removed)
+        )
+        df[self._INDEX_CATEGORY] = self.to_categorical(
+            self.clean_column_memoized(
+                df[self._INDEX_CATEGORY], self.clean_product_category
             )
+        )
 
-            if df.at[index, self._INDEX_PRODUCT_CODE] is None:
-                print(f"The row with index {row[self._INDEX]} will be deleted!")
-                df.drop(index, inplace=True)
+        return df
+
+    def __drop_rejected_rows(
+        self, df: DataFrame, column_name: str, raw_column: Series
+    ) -> Tuple[DataFrame, DataFrame]:
+        """
+        Drop, in one step, all the rows where the column value was cleaned to None.
+        Returns the kept rows and the rejected rows, whose column has the raw value
+        that caused the rejection.
+
+        * Parameters:
+            - df: Dataframe
+            - column_name: string
+            - raw_column: Series -> The column before the cleaning (same rows and order).
+        """
+        is_rejected: Series = df[column_name].isna()
+        df_rejected: DataFrame = df[is_rejected].copy()
+        df_rejected[column_name] = raw_column[is_rejected.to_numpy()].to_numpy()
+        if not df_rejected.empty and self._INDEX in df_rejected.columns:
+            indexes: List = df_rejected[self._INDEX].to_list()
+            print(f"The rows with index {indexes} will be deleted!")
+
+        return df[~is_rejected], df_rejected
+
+    def _clean_partitions(
+        self,
+        df: DataFrame,
+        clean_rows: Callable[[DataFrame], DataFrame],
+        workers: int = 1,
+        partition_size: int = None,
+    ) -> DataFrame:
+        """
+        Split the Dataframe in partitions of rows and clean them in a process pool.
+        The cleaned partitions are concatenated back in the original order.
+        If workers is 1 (or less), the whole Dataframe is cleaned in this process.
+
+        * Parameters:
+            - df: Dataframe
+            - clean_rows: Callable -> Method that cleans the columns of a Dataframe partition.
+            - workers: integer
+            - partition_size: integer -> Default is the number of rows divided by workers.
+        """
+        if workers <= 1 or df.empty:
+            return clean_rows(df)
+
+        if not partition_size:
+            partition_size = math.ceil(len(df) / workers)
+        partitions: List[DataFrame] = [
+            df.iloc[start : start + partition_size]
+            for start in range(0, len(df), partition_size)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            cleaned_partitions: List[DataFrame] = list(
+                executor.map(clean_rows, partitions)
+            )
+
+        df = pd.concat(cleaned_partitions)
+        # Partitions with different categories are concatenated as object, so their
+        # categories are merged back.
+        for column in cleaned_partitions[0].select_dtypes("category").columns:
+            if not isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = Series(
+                    union_categoricals(
+                        [partition[column] for partition in cleaned_partitions]
+                    ),
+                    index=df.index,
+                )
 
         return df
 
-    def clean_orders_data(self, df: DataFrame) -> DataFrame:
+    def clean_chunks(
+        self, chunks: Iterable[DataFrame], clean_data: Callable[[DataFrame], DataFrame]
+    ) -> Iterator[DataFrame]:
+        """
+        Clean each chunk of a Dataframe read in chunks (DataExtractor.stream_rds_table,
+        for instance) as soon as it is read, so only one chunk is in memory at a time.
+
+        * Parameters:
+            - chunks: Iterable of Dataframes
+            - clean_data: Callable -> Method that cleans a Dataframe (clean_orders_data, for instance).
+        """
+        for chunk in chunks:
+            yield clean_data(chunk)
+
+    def clean_orders_data(
+        self,
+        df: DataFrame,
+        workers: int = 1,
+        partition_size: int = None,
+        is_packed: bool = True,
+    ) -> DataFrame:
         """
         Clean the orders data.
+        Read the table with columns=_ORDERS_COLUMNS, so the dropped columns are not
+        transferred.
+        The packed orders also keep store_code and product_code as Categoricals, since
+        each code is repeated in many orders.
 
         * Parameters:
             - df: Dataframe
+            - workers: integer -> Number of processes. The data is cleaned in parallel if it is greater than 1.
+            - partition_size: integer -> Number of rows of each partition cleaned in parallel.
+            - is_packed: boolean -> If this option is False, the identifiers are not packed (see pack_identifiers).
         """
-        df = df.drop(["level_0", "first_name", "last_name", "1"], axis=1)
-        for index, row in df.iterrows():
-            df.at[index, self._INDEX_DATE_UUID] = self.clean_uuid(
-                row[self._INDEX_DATE_UUID]
-            )
-            df.at[index, self._INDEX_USER_UUID] = self.clean_uuid(
-                row[self._INDEX_USER_UUID]
+        df = df.drop(
+            ["level_0", "first_name", "last_name", "1"], axis=1, errors="ignore"
+        )
+        df = self._clean_partitions(
+            df, self._clean_orders_rows, workers, partition_size
+        )
+        if is_packed:
+            df = self.pack_identifiers(
+                df, category_columns=[self._INDEX_STORE_CODE, self._INDEX_PRODUCT_CODE]
             )
+
+        return df
+
+    def _clean_orders_rows(self, df: DataFrame) -> DataFrame:
+        """
+        Clean the columns of the orders data.
+
+        * Parameters:
+            - df: Dataframe
+        """
+        df = self._ORDERS_RULES.apply(df)
+        for index, row in df.iterrows():
             df.at[index, self._INDEX_CARD_NUMBER] = self.clean_integer_number(
                 row[self._INDEX_CARD_NUMBER]
             )
-            df.at[index, self._INDEX_STORE_CODE] = self.clean_store_code(
-                row[self._INDEX_STORE_CODE]
-            )
-            df.at[index, self._INDEX_STORE_CODE] = self.clean_store_code(
-                row[self._INDEX_STORE_CODE]
-            )
-            df.at[index, self._INDEX_PRODUCT_CODE] = self.clean_product_code(
-                row[self._INDEX_PRODUCT_CODE]
-            )
             df.at[index, self._INDEX_PRODUCT_QUANTITY] = self.clean_integer_number(
                 row[self._INDEX_PRODUCT_QUANTITY]
             )
 
         return df
 
-    def clean_date_details(self, df: DataFrame) -> DataFrame:
+    def pack_identifiers(
+        self, df: DataFrame, category_columns: List[str] = ()
+    ) -> DataFrame:
+        """
+        Replace the cleaned uuid columns (date_uuid, user_uuid and uuid) by two uint64
+        columns ({column}_hi and {column}_lo) and the card number by a nullable integer.
+        upload_to_db converts them back to the Postgres UUID and BIGINT types.
+        The clean_*_data methods call it, unless is_packed is False.
+
+        * Parameters:
+            - df: Dataframe
+            - category_columns: List of strings -> Columns converted to Categorical.
+        """
+        return identifiers.pack_identifiers(
+            df,
+            uuid_columns=[
+                self._INDEX_DATE_UUID,
+                self._INDEX_USER_UUID,
+                self._INDEX_UUID,
+            ],
+            integer_columns=[self._INDEX_CARD_NUMBER],
+            category_columns=category_columns,
+        )
+
+    def clean_date_details(
+        self,
+        df: DataFrame,
+        workers: int = 1,
+        partition_size: int = None,
+        is_packed: bool = True,
+    ) -> DataFrame:
         """
         Clean the date details data.
 
         * Parameters:
             - df: Dataframe
+            - workers: integer -> Number of processes. The data is cleaned in parallel if it is greater than 1.
+            - partition_size: integer -> Number of rows of each partition cleaned in parallel.
+            - is_packed: boolean -> If this option is False, the identifiers are not packed (see pack_identifiers).
         """
         df.reset_index(inplace=True)
+        df = self._clean_partitions(
+            df, self._clean_date_details_rows, workers, partition_size
+        )
+        if is_packed:
+            df = self.pack_identifiers(df)
+
+        return df
+
+    def _clean_date_details_rows(self, df: DataFrame) -> DataFrame:
+        """
+        Clean the columns of the date details data.
+
+        * Parameters:
+            - df: Dataframe
+        """
+        df = self._DATE_DETAILS_RULES.apply(df)
         for index, row in df.iterrows():
-            df.at[index, self._INDEX_DATE_UUID] = self.clean_uuid(
-                row[self._INDEX_DATE_UUID]
-            )
-            df.at[index, self._INDEX_TIME_PERIOD] = self.clean_time_period(
-                row[self._INDEX_TIME_PERIOD]
-            )
             df.at[index, self._INDEX_TIMESTAMP] = self.clean_timestamp(
                 row[self._INDEX_TIMESTAMP]
             )
@@ -246,6 +585,12 @@ class DataCleaning(BaseDataCleaner, DatabaseConnector):
             df.at[index, self._INDEX_MONTH] = self.clean_month(row[self._INDEX_MONTH])
             df.at[index, self._INDEX_YEAR] = self.clean_year(row[self._INDEX_YEAR])
 
+        df[self._INDEX_TIME_PERIOD] = self.to_categorical(
+            self.clean_column_memoized(
+                df[self._INDEX_TIME_PERIOD], self.clean_time_period
+            )
+        )
+
         return df
 
     def add_data_into_weight_class(self) -> None:
@@ -260,10 +605,10 @@ class DataCleaning(BaseDataCleaner, DatabaseConnector):
             | Truck_Required           | => 140            |
             +----------------------------+-----------------+
         """
-        LIGHT: str = "Light"
-        MID_SIZED: str = "Mid_Sized"
-        HEAVY: str = "Heavy"
-        TRUCK_REQUIRED = "Truck_Required"
+        LIGHT: str = self._WEIGHT_CLASS_LIGHT
+        MID_SIZED: str = self._WEIGHT_CLASS_MID_SIZED
+        HEAVY: str = self._WEIGHT_CLASS_HEAVY
+        TRUCK_REQUIRED = self._WEIGHT_CLASS_TRUCK_REQUIRED
 
         select_query = "SELECT index, weight FROM dim_products;"
         df: DataFrame = self.select_db(select_query)
@@ -1,21 +1,90 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+import json
+import math
+import os
+import tempfile
+import time
+from urllib.parse import urlparse
 import pandas as pd
-import tabula
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yaml
-from typing import Dict, List, Union
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
 
 from pandas import DataFrame
-from sqlalchemy import Connection, CursorResult, Engine, text
+from sqlalchemy import CursorResult, Engine, text
 import boto3
 from botocore.exceptions import NoCredentialsError, ClientError
 
+try:
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
+
 from .database_utils import DatabaseConnector
+from .http_cache import HttpCache
+from . import json_stream, pdf_backends, pdf_cache, pg_copy
+from .row_filters import RangeFilter, key_bounds_query, select_query, split_key_range
 
 
 class DataExtractor:
 
-    def __init__(self):
-        self.config = self.read_config()
+    _HTTP_TIMEOUT: int = 30
+    _HTTP_RETRIES: int = 5
+    _HTTP_BACKOFF_FACTOR: float = 0.5
+    _HTTP_RETRY_STATUS: List[int] = [429, 500, 502, 503, 504]
+    _HTTP_POOL_SIZE: int = 32
+    _HTTP_CHUNK_SIZE: int = 1024 * 1024
+    _HTTP_CACHE_DIR: str = "data/http_cache"
+    _STORES_JOURNAL: str = "data/stores_journal.jsonl"
+    _S3_CHUNK_SIZE: int = 100_000
+    _RDS_CHUNK_SIZE: int = 50_000
+    # Dataframes extracted from S3 in this process, by (bucket, file).
+    __s3_frames: Dict[Tuple[str, str], DataFrame] = {}
+
+    def __init__(self, config: Dict = None):
+        """
+        * Parameters:
+            - config: Dict -> If it is None, the config is read from config/config.yaml.
+
+        Optional keys of the config (HTTP response cache):
+            - http_cache: bool -> Enable the cache (default True).
+            - http_cache_dir: string -> Folder of the cache (default data/http_cache).
+            - http_cache_ttl: int -> Seconds a cached response is used without asking the
+              server. If it is None (default), every request is a conditional GET.
+            - http_offline: bool -> Only use the cache, never the network (default False).
+
+        Optional keys of the config (cache of the tables extracted from pdf documents):
+            - pdf_cache: bool -> Enable the cache (default True).
+            - pdf_cache_dir: string -> Folder of the cache (default data/pdf_cache).
+            - pdf_cache_max_size: int -> Maximum size of the cache in bytes (default 256 MB).
+            - pdf_backend: string -> "tabula" (default) or "pdfplumber" (no Java VM).
+
+        Optional keys of the config (S3):
+            - s3_endpoint_url: string -> Url of an S3 compatible service (local stand-in, for instance).
+        """
+        self.config = config if config is not None else self.read_config()
+        self.__session: Union[requests.Session, None] = None
+        self.http_cache: Union[HttpCache, None] = (
+            HttpCache(self.config.get("http_cache_dir", self._HTTP_CACHE_DIR))
+            if self.config.get("http_cache", True)
+            else None
+        )
+        self.http_cache_ttl: Union[int, None] = self.config.get("http_cache_ttl")
+        self.is_offline: bool = self.config.get("http_offline", False)
+        self.pdf_cache: Union[pdf_cache.PdfTableCache, None] = (
+            pdf_cache.PdfTableCache(
+                self.config.get("pdf_cache_dir", pdf_cache.DEFAULT_DIRECTORY),
+                self.config.get("pdf_cache_max_size", pdf_cache.DEFAULT_MAX_SIZE),
+            )
+            if self.config.get("pdf_cache", True)
+            else None
+        )
+        self.pdf_backend: str = self.config.get(
+            "pdf_backend", pdf_backends.DEFAULT_BACKEND
+        )
 
     def read_config(self) -> Dict:
         """
@@ -25,17 +94,100 @@ class DataExtractor:
             config = yaml.safe_load(file)
         return config
 
+    def _get_session(self) -> requests.Session:
+        """
+        Return the HTTP session shared by all the requests (and threads) of this extractor.
+        Its connections are kept alive in a pool, and the requests are retried with
+        exponential backoff when the response status is 429 or 5xx.
+        """
+        if self.__session is None:
+            retry: Retry = Retry(
+                total=self._HTTP_RETRIES,
+                backoff_factor=self._HTTP_BACKOFF_FACTOR,
+                status_forcelist=self._HTTP_RETRY_STATUS,
+                allowed_methods=["GET"],
+                raise_on_status=False,
+            )
+            adapter: HTTPAdapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=self._HTTP_POOL_SIZE, max_retries=retry
+            )
+            session: requests.Session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self.__session = session
+        return self.__session
+
     def __http_get_request(self, url: str) -> Union[Dict, None]:
         """
+        Request the url and return its JSON.
+
         * Parameters:
             - url: string
         """
-        header: dict = {"x-api-key": self.config["x-api-key"]}
-        response = requests.get(url, headers=header)
+        chunks: Union[Iterator[bytes], None] = self.__http_get_stream(url)
+        if chunks is None:
+            return None
+        return json.loads(b"".join(chunks))
+
+    def __http_get_stream(self, url: str) -> Union[Iterator[bytes], None]:
+        """
+        Request the url and return its body in chunks (None if it is not available).
+        If the response is cached, it is used without asking the server while its age is
+        lower than the TTL (or always, in offline mode). Otherwise, the request is sent
+        with If-None-Match/If-Modified-Since and the cached body is used on a 304.
+        A new body is written to the cache while it is read.
+
+        * Parameters:
+            - url: string
+        """
+        api_key: str = self.config["x-api-key"]
+        cached: Union[Dict, None] = (
+            self.http_cache.get(url, api_key, with_body=False)
+            if self.http_cache
+            else None
+        )
+        if cached is not None and (
+            self.is_offline
+            or (
+                self.http_cache_ttl is not None
+                and time.time() - cached["stored_at"] < self.http_cache_ttl
+            )
+        ):
+            return self.http_cache.iter_body(url, api_key)
+        if self.is_offline:
+            print(f"The url {url} is not cached (offline mode)!")
+            return None
+
+        header: dict = {"x-api-key": api_key}
+        if cached is not None:
+            if cached["etag"]:
+                header["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                header["If-Modified-Since"] = cached["last_modified"]
+        response = self._get_session().get(
+            url, headers=header, timeout=self._HTTP_TIMEOUT, stream=True
+        )
+        if response.status_code == 304 and cached is not None:
+            response.close()
+            self.http_cache.touch(url, api_key)
+            return self.http_cache.iter_body(url, api_key)
         if response.status_code != 200:
+            response.close()
             return None
 
-        return response.json()
+        def read_response() -> Iterator[bytes]:
+            with response:
+                yield from response.iter_content(self._HTTP_CHUNK_SIZE)
+
+        if self.http_cache:
+            return self.http_cache.put_stream(
+                url,
+                api_key,
+                read_response(),
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+        return read_response()
 
     def list_db_tables(self) -> List[str]:
         """
@@ -43,37 +195,280 @@ class DataExtractor:
         """
         db: DatabaseConnector = DatabaseConnector()
         engine: Engine = db.init_db_engine(is_localhost=False)
-        connection: Connection = engine.connect()
-        tables: CursorResult = connection.execute(
-            text(
-                "SELECT * FROM pg_catalog.pg_tables WHERE schemaname != 'pg_catalog' AND schemaname != 'information_schema'"
+        # The connection is returned to the pool of the engine, which is shared.
+        with engine.connect() as connection:
+            tables: CursorResult = connection.execute(
+                text(
+                    "SELECT * FROM pg_catalog.pg_tables WHERE schemaname != 'pg_catalog' AND schemaname != 'information_schema'"
+                )
             )
-        )
-        return [table[1] for table in tables]
+            return [table[1] for table in tables]
 
-    def read_rds_table(self, db: DatabaseConnector, table_name: str) -> DataFrame:
+    def read_rds_table(
+        self,
+        db: DatabaseConnector,
+        table_name: str,
+        columns: List[str] = None,
+        filters: Sequence[RangeFilter] = (),
+        method: str = "read_sql",
+    ) -> DataFrame:
         """
         Read data from postgres table using pandas.
+        Only the columns and the rows of the filters are transferred (they are pushed
+        into the sql query).
         Parameters:
             - db: DatabaseConnector
             - table_name: string
+            - columns: List of strings -> If it is None, all the columns are read.
+            - filters: List of RangeFilter -> Key range or watermark of the rows.
+            - method: string -> "read_sql" (pd.read_sql) or "copy" (COPY ... TO STDOUT parsed as csv, much faster for big tables).
         """
         engine: Engine = db.init_db_engine(is_localhost=False)
-        sql: str = f"SELECT * FROM {table_name}"
-        df: DataFrame = pd.read_sql(sql, con=engine)
+        return self._read_query(
+            engine, select_query(table_name, columns, filters), method
+        )
+
+    def _read_query(self, engine: Engine, query, method: str) -> DataFrame:
+        """
+        * Parameters:
+            - engine: Engine
+            - query: Select
+            - method: string -> "read_sql" or "copy"
+        """
+        if method == "copy":
+            return pg_copy.read_query(engine, query)
+        if method != "read_sql":
+            raise ValueError(
+                f"The method '{method}' does not exist! Use 'read_sql' or 'copy'."
+            )
+        df: DataFrame = pd.read_sql(query, con=engine)
         return df
 
-    def retrieve_pdf_data(self, pdf_path: str) -> DataFrame:
+    def stream_rds_table_partitions(
+        self,
+        db: DatabaseConnector,
+        table_name: str,
+        partitions: int = 4,
+        key: str = "index",
+        columns: List[str] = None,
+        filters: Sequence[RangeFilter] = (),
+        method: str = "read_sql",
+        is_ordered: bool = True,
+    ) -> Iterator[DataFrame]:
+        """
+        Split the table in ranges of the numeric key and read them at the same time, one
+        connection of the engine pool per range.
+        * Parameters:
+            - db: DatabaseConnector
+            - table_name: string
+            - partitions: integer -> Number of ranges (and concurrent connections).
+            - key: string -> Integer column.
+            - columns: List of strings -> If it is None, all the columns are read.
+            - filters: List of RangeFilter -> Key range or watermark of the rows.
+            - method: string -> "read_sql" or "copy"
+            - is_ordered: boolean -> If this option is False, the ranges are yielded as soon as they are read, instead of in key order.
+        """
+        engine: Engine = db.init_db_engine(is_localhost=False)
+        with engine.connect() as connection:
+            minimum, maximum = connection.execute(
+                key_bounds_query(table_name, key, filters)
+            ).one()
+        if minimum is None:
+            return
+
+        queries = [
+            select_query(table_name, columns, [*filters, key_range])
+            for key_range in split_key_range(key, minimum, maximum, partitions)
+        ]
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            if is_ordered:
+                yield from executor.map(
+                    partial(self._read_query, engine, method=method), queries
+                )
+            else:
+                futures = [
+                    executor.submit(self._read_query, engine, query, method)
+                    for query in queries
+                ]
+                for future in as_completed(futures):
+                    yield future.result()
+
+    def read_rds_table_partitioned(
+        self,
+        db: DatabaseConnector,
+        table_name: str,
+        partitions: int = 4,
+        key: str = "index",
+        columns: List[str] = None,
+        filters: Sequence[RangeFilter] = (),
+        method: str = "read_sql",
+    ) -> DataFrame:
+        """
+        Read the table in parallel key ranges (see stream_rds_table_partitions) and
+        concatenate them in key order.
+        * Parameters:
+            - db: DatabaseConnector
+            - table_name: string
+            - partitions: integer -> Number of ranges (and concurrent connections).
+            - key: string -> Integer column.
+            - columns: List of strings -> If it is None, all the columns are read.
+            - filters: List of RangeFilter -> Key range or watermark of the rows.
+            - method: string -> "read_sql" or "copy"
+        """
+        dfs: List[DataFrame] = list(
+            self.stream_rds_table_partitions(
+                db, table_name, partitions, key, columns, filters, method
+            )
+        )
+        if not dfs:
+            return self.read_rds_table(db, table_name, columns, filters, method)
+        return pd.concat(dfs, ignore_index=True)
+
+    def stream_rds_table(
+        self,
+        db: DatabaseConnector,
+        table_name: str,
+        chunksize: int = None,
+        columns: List[str] = None,
+        filters: Sequence[RangeFilter] = (),
+    ) -> Iterator[DataFrame]:
+        """
+        Read data from postgres table in Dataframes of chunksize rows.
+        The rows are fetched with a server-side cursor, so only one chunk is in memory
+        at a time. The index of the chunks continues from one chunk to the next, as in
+        read_rds_table.
+        * Parameters:
+            - db: DatabaseConnector
+            - table_name: string
+            - chunksize: integer -> Default is 50000 rows.
+            - columns: List of strings -> If it is None, all the columns are read.
+            - filters: List of RangeFilter -> Key range or watermark of the rows.
+        """
+        engine: Engine = db.init_db_engine(is_localhost=False)
+        start: int = 0
+        with engine.connect().execution_options(stream_results=True) as connection:
+            for chunk in pd.read_sql(
+                select_query(table_name, columns, filters),
+                con=connection,
+                chunksize=chunksize or self._RDS_CHUNK_SIZE,
+            ):
+                chunk.index = pd.RangeIndex(start, start + len(chunk))
+                start += len(chunk)
+                yield chunk
+
+    def retrieve_pdf_data(
+        self,
+        pdf_path: str,
+        workers: int = 1,
+        pages_per_task: int = None,
+        backend: str = None,
+    ) -> DataFrame:
         """
         Extract data from pdf documents.
+        The pdf is downloaded once and the extracted tables are cached by the hash of its
+        bytes, so an unchanged pdf is not parsed again.
+        If workers is greater than 1 (and pypdf is installed), its pages are extracted in
+        parallel, in ranges of pages_per_task pages. The tables are concatenated in page
+        order, as in the serial extraction.
 
         * Parameters:
-            - pdf_path: string
+            - pdf_path: string -> url or local path
+            - workers: integer -> Number of processes.
+            - pages_per_task: integer -> Default is the number of pages divided by workers.
+            Without jpype, each tabula task starts a Java VM, so smaller ranges are slower.
+            - backend: string -> "tabula" or "pdfplumber". If it is None, the pdf_backend of the config is used.
         """
-        dfs: DataFrame = tabula.read_pdf(pdf_path, pages="all")
-        df: DataFrame = pd.concat(dfs).reset_index(level=0)
+        backend = backend or self.pdf_backend
+        with tempfile.TemporaryDirectory() as directory:
+            local_path: str = self.__download_pdf(pdf_path, directory)
+            key: Union[str, None] = None
+            if self.pdf_cache:
+                key = f"{self.pdf_cache.key(local_path)}_{backend}"
+                cached: Union[DataFrame, None] = self.pdf_cache.get(key)
+                if cached is not None:
+                    return cached
+
+            df: DataFrame = self.__extract_pdf_tables(
+                local_path, workers, pages_per_task, backend
+            )
+
+        if self.pdf_cache:
+            self.pdf_cache.put(key, df)
         return df
 
+    def __extract_pdf_tables(
+        self,
+        pdf_path: str,
+        workers: int,
+        pages_per_task: Union[int, None],
+        backend: str,
+    ) -> DataFrame:
+        """
+        * Parameters:
+            - pdf_path: string -> local path
+            - workers: integer
+            - pages_per_task: integer -> If it is None, one range of pages per worker.
+            - backend: string
+        """
+        if workers <= 1 or PdfReader is None:
+            dfs: List[DataFrame] = pdf_backends.read_pdf(pdf_path, "all", backend)
+            df: DataFrame = pd.concat(dfs).reset_index(level=0)
+            return df
+
+        number_of_pages: int = len(PdfReader(pdf_path).pages)
+        if not pages_per_task:
+            pages_per_task = math.ceil(number_of_pages / workers)
+        page_ranges: List[List[int]] = [
+            list(range(first, min(first + pages_per_task, number_of_pages + 1)))
+            for first in range(1, number_of_pages + 1, pages_per_task)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(page_ranges))
+        ) as executor:
+            dfs = (
+                page_df
+                for page_dfs in executor.map(
+                    partial(self._read_pdf_pages, pdf_path, backend=backend),
+                    page_ranges,
+                )
+                for page_df in page_dfs
+            )
+            df = pd.concat(dfs).reset_index(level=0)
+        return df
+
+    @staticmethod
+    def _read_pdf_pages(
+        pdf_path: str, pages: List[int], backend: str
+    ) -> List[DataFrame]:
+        """
+        Extract the tables of the pages (one process of retrieve_pdf_data).
+
+        * Parameters:
+            - pdf_path: string
+            - pages: List of integers
+            - backend: string
+        """
+        return pdf_backends.read_pdf(pdf_path, pages, backend)
+
+    def __download_pdf(self, pdf_path: str, directory: str) -> str:
+        """
+        Download the pdf into the directory and return its local path.
+        Local paths are returned as they are.
+
+        * Parameters:
+            - pdf_path: string
+            - directory: string
+        """
+        if urlparse(pdf_path).scheme not in ("http", "https"):
+            return pdf_path
+
+        response = self._get_session().get(pdf_path, timeout=self._HTTP_TIMEOUT)
+        response.raise_for_status()
+        local_path: str = os.path.join(directory, "document.pdf")
+        with open(local_path, "wb") as file:
+            file.write(response.content)
+        return local_path
+
     def list_number_of_stores(self) -> str:
         """
         Return total number of stores using REST API.
@@ -82,45 +477,187 @@ class DataExtractor:
         data: Union[Dict, None] = self.__http_get_request(url)
         return data["number_stores"]
 
-    def retrieve_stores_data(self, number_of_stores: int) -> DataFrame:
+    def retrieve_stores_data(
+        self, number_of_stores: int, workers: int = 10, journal_path: str = None
+    ) -> DataFrame:
         """
         Retrieve each store data via rest api.
+        The stores are requested concurrently and returned in store number order.
+        Each store is saved in a journal (JSON lines) as soon as it is retrieved, so a
+        failed run can be resumed: the next call only requests the stores missing in
+        the journal. The journal is deleted when all the stores are retrieved.
         * Parameters:
             - number_of_stores: int -> total number of stores
+            - workers: int -> maximum number of concurrent requests
+            - journal_path: string -> If it is None, data/stores_journal.jsonl is used.
         """
-        list_stores_data: List[Dict] = []
-        for store_number in range(number_of_stores):
-            url: str = f"{self.config['aws_url_store_details']}/{store_number}"
-            data: Dict = self.__http_get_request(url)
-            if data:
-                list_stores_data.append(data)
+        journal_path = journal_path or self._STORES_JOURNAL
+        url: str = self.config["aws_url_store_details"]
+        stores: Dict[int, Dict] = self.__read_stores_journal(journal_path, url)
+        missing: List[int] = [
+            store_number
+            for store_number in range(number_of_stores)
+            if store_number not in stores
+        ]
+        if stores:
+            print(
+                f"Resuming from the journal: {len(stores)} stores retrieved, {len(missing)} missing."
+            )
+
+        if missing:
+            os.makedirs(os.path.dirname(journal_path) or ".", exist_ok=True)
+            with open(journal_path, "a") as journal, ThreadPoolExecutor(
+                max_workers=max(1, min(workers, self._HTTP_POOL_SIZE))
+            ) as executor:
+                if journal.tell() > 0:
+                    # A previous run may have been interrupted in the middle of a line.
+                    journal.write("\n")
+                futures = {
+                    executor.submit(self._retrieve_store, store_number): store_number
+                    for store_number in missing
+                }
+                for future in as_completed(futures):
+                    data: Union[Dict, None] = future.result()
+                    if not data:
+                        continue
+                    store_number: int = futures[future]
+                    stores[store_number] = data
+                    journal.write(
+                        json.dumps(
+                            {"url": url, "store_number": store_number, "data": data}
+                        )
+                        + "\n"
+                    )
+                    journal.flush()
+
+        still_missing: List[int] = [
+            store_number
+            for store_number in range(number_of_stores)
+            if store_number not in stores
+        ]
+        if still_missing:
+            print(
+                f"The stores {still_missing} could not be retrieved! Run it again to retry them."
+            )
+        elif os.path.exists(journal_path):
+            os.remove(journal_path)
+
+        list_stores_data: List[Dict] = [
+            stores[store_number] for store_number in sorted(stores)
+        ]
 
         df: DataFrame = pd.DataFrame.from_records(list_stores_data)
         return df
 
+    def _retrieve_store(self, store_number: int) -> Union[Dict, None]:
+        """
+        Retrieve the data of one store. If the request fails, return None.
+
+        * Parameters:
+            - store_number: int
+        """
+        try:
+            return self.__http_get_request(
+                f"{self.config['aws_url_store_details']}/{store_number}"
+            )
+        except requests.RequestException as e:
+            print(f"The store {store_number} could not be retrieved: {e}")
+            return None
+
+    def __read_stores_journal(self, journal_path: str, url: str) -> Dict[int, Dict]:
+        """
+        Read the stores saved by a previous run of retrieve_stores_data.
+        Records of another url and incomplete lines (interrupted run) are ignored.
+
+        * Parameters:
+            - journal_path: string
+            - url: string
+        """
+        stores: Dict[int, Dict] = {}
+        try:
+            with open(journal_path, "r") as journal:
+                for line in journal:
+                    try:
+                        record: Dict = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if record.get("url") == url:
+                        stores[record["store_number"]] = record["data"]
+        except FileNotFoundError:
+            pass
+        return stores
+
+    def _get_s3_client(self):
+        """
+        Return a boto3 S3 client (of s3_endpoint_url, if it is in the config).
+        """
+        return boto3.client("s3", endpoint_url=self.config.get("s3_endpoint_url"))
+
     def extract_from_s3(
-        self, bucket_name: str, bucket_filename: str, destiny_filename: str
+        self, bucket_name: str, bucket_filename: str, destiny_filename: str = None
     ) -> Union[DataFrame, None]:
         """
         Download and extract the information from the file stored in S3 AWS service.
+        The file is only downloaded again if the ETag of the object (HEAD request) is not
+        the ETag of the last download, saved in {destiny_filename}.etag.
+        If destiny_filename is None, the file is not saved: its chunks are read from the
+        object body (see stream_from_s3).
+        The Dataframe is kept in memory, so the next calls of this process do not
+        request S3 again.
+
+        * Parameters:
+            - bucket_name: string
+            - bucket_filename: string
+            - destiny_filename: string
+        """
+        key: Tuple[str, str] = (bucket_name, bucket_filename)
+        if key not in self.__s3_frames:
+            if destiny_filename is None:
+                chunks: List[DataFrame] = list(
+                    self.stream_from_s3(bucket_name, bucket_filename)
+                )
+                df: Union[DataFrame, None] = pd.concat(chunks) if chunks else None
+            else:
+                df = self.__download_from_s3(
+                    bucket_name, bucket_filename, destiny_filename
+                )
+            if df is None:
+                return None
+            self.__s3_frames[key] = df
+
+        return self.__s3_frames[key].copy()
 
+    def __download_from_s3(
+        self, bucket_name: str, bucket_filename: str, destiny_filename: str
+    ) -> Union[DataFrame, None]:
+        """
         * Parameters:
             - bucket_name: string
             - bucket_filename: string
             - destiny_filename: string
         """
+        etag_filename: str = f"{destiny_filename}.etag"
         try:
-            s3 = boto3.client("s3")
-            s3.download_file(
-                bucket_name,
-                bucket_filename,
-                destiny_filename,
-            )
+            s3 = self._get_s3_client()
+            etag: str = s3.head_object(Bucket=bucket_name, Key=bucket_filename)["ETag"]
+            cached_etag: Union[str, None] = None
+            if os.path.exists(destiny_filename) and os.path.exists(etag_filename):
+                with open(etag_filename, "r") as file:
+                    cached_etag = file.read()
+
+            if etag != cached_etag:
+                s3.download_file(
+                    bucket_name,
+                    bucket_filename,
+                    destiny_filename,
+                )
+                with open(etag_filename, "w") as file:
+                    file.write(etag)
             df: DataFrame = pd.read_csv(destiny_filename, index_col=0)
             return df
         except ClientError as e:
-            if e.response["Error"]["Code"] == "NoSuchBucket":
-                print("The specified bucket does not exist.")
+            if e.response["Error"]["Code"] in ("NoSuchBucket", "404"):
+                print("The specified bucket or file does not exist.")
             else:
                 print("An error occurred:", e)
             return None
@@ -128,12 +665,54 @@ class DataExtractor:
             print(e)
             return None
 
-    def extract_json_from_s3(self, url: str) -> Union[DataFrame, None]:
+    def stream_from_s3(
+        self, bucket_name: str, bucket_filename: str, chunksize: int = None
+    ) -> Iterator[DataFrame]:
+        """
+        Read the csv file stored in S3 AWS service directly from the object body,
+        without a local file, and yield it in Dataframes of chunksize rows.
+
+        * Parameters:
+            - bucket_name: string
+            - bucket_filename: string
+            - chunksize: integer -> Default is 100000 rows.
+        """
+        try:
+            s3 = self._get_s3_client()
+            response: Dict = s3.get_object(Bucket=bucket_name, Key=bucket_filename)
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "NoSuchBucket":
+                print("The specified bucket does not exist.")
+            else:
+                print("An error occurred:", e)
+            return
+
+        body = response["Body"]
+        try:
+            with pd.read_csv(
+                body, index_col=0, chunksize=chunksize or self._S3_CHUNK_SIZE
+            ) as reader:
+                for chunk in reader:
+                    yield chunk
+        finally:
+            body.close()
+
+    def extract_json_from_s3(
+        self, url: str, is_streaming: bool = False
+    ) -> Union[DataFrame, None]:
         """
         * Parameters:
             - url: string
+            - is_streaming: boolean -> If this option is True, the body is parsed while it
+            is downloaded (see json_stream), instead of loading the whole document first.
         """
         df = None
+        if is_streaming:
+            chunks: Union[Iterator[bytes], None] = self.__http_get_stream(url)
+            if chunks is not None:
+                df = json_stream.read_dataframe(chunks)
+            return df
+
         json_data = self.__http_get_request(url)
         if json_data:
             df = pd.DataFrame.from_records(json_data)
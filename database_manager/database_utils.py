@@ -1,16 +1,22 @@
-from typing import Dict, List, Union
+import itertools
+import time
+from typing import Dict, Iterable, Iterator, List, Union
 
 from .base_database_connector import BaseDatabaseConnector
+from . import identifiers, pg_copy
 
 import pandas as pd
 from pandas import DataFrame
 
-from sqlalchemy import Engine
+from sqlalchemy import Engine, text
 from sqlalchemy import exc
 
 
 class DatabaseConnector(BaseDatabaseConnector):
 
+    # Number of rows converted from the packed identifiers at a time during the upload.
+    _UPLOAD_CHUNK_SIZE: int = 100_000
+
     def read_db_creds(self, filename: str) -> Dict:
         """
         Read credentials DB.
@@ -23,45 +29,185 @@ class DatabaseConnector(BaseDatabaseConnector):
     def init_db_engine(self, is_localhost: bool = True) -> Engine:
         """
         Create a engine for postgress DataBase.
+        The engine is created once per process and credentials, and then reused.
 
         * Parameters:
             - is_localhost: boolean
         """
         return self._create_engine(is_localhost=is_localhost)
 
+    def pool_statistics(self) -> Dict[str, Dict]:
+        """
+        Return the connection pool state and counters of each engine, by credentials file.
+        """
+        return self._pool_statistics()
+
+    def dispose_engines(self) -> None:
+        """
+        Close the pooled connections of all the engines.
+        """
+        self._dispose_engines()
+
     def upload_to_db(
         self,
-        df: DataFrame,
+        df: Union[DataFrame, Iterable[DataFrame]],
         table_name: str,
         column_types: Dict = None,
         using_query: bool = False,
+        method: str = "to_sql",
     ):
         """
         Upload the Dataframe data to localhost database.
 
         * Parameters:
-            - df: DataFrame,
+            - df: DataFrame or Iterable of Dataframes -> The chunks of an Iterable are uploaded one by one.
             - table_name: string,
             - column_types: Dict,
             - using_query: boolean -> If this option is True, the table will be created and filled with manual sql queries.
+            - method: string -> "to_sql" (df.to_sql) or "copy" (COPY ... FROM STDIN, much faster for big tables).
         """
+        if method not in ("to_sql", "copy"):
+            raise ValueError(
+                f"The method '{method}' does not exist! Use 'to_sql' or 'copy'."
+            )
+        dfs: Iterator[DataFrame] = iter([df] if isinstance(df, DataFrame) else df)
+        # The table is only dropped once there is data to replace it (a stream of
+        # chunks can be empty when its filters do not match any row).
+        first_df: Union[DataFrame, None] = next(dfs, None)
+        if first_df is None:
+            print(
+                f"There is no data to upload to {table_name}! The table was not changed."
+            )
+            return
+        dfs = itertools.chain([first_df], dfs)
+
         engine: Engine = self._create_engine()
         self._drop_table(engine, table_name)
-        if using_query:
+        if method == "copy" and not using_query:
+            self.__copy_to_db(engine, dfs, table_name, column_types)
+        elif using_query:
             self._create_table(engine, table_name, column_types)
-            self._insert_data(engine, table_name, df)
+            for df_chunk in dfs:
+                self._insert_data(
+                    engine, table_name, identifiers.unpack_identifiers(df_chunk)
+                )
         else:
             try:
-                df.to_sql(
-                    table_name,
-                    con=engine,
-                    if_exists="replace",
-                    dtype=column_types,
-                    index=False,
-                )
+                is_first_chunk: bool = True
+                for df_part in dfs:
+                    # Packed uuid columns are converted back chunk by chunk, so the
+                    # uuid objects of the whole table are never in memory at once.
+                    chunk_size: int = (
+                        self._UPLOAD_CHUNK_SIZE
+                        if identifiers.packed_uuid_columns(df_part)
+                        else max(len(df_part), 1)
+                    )
+                    for start in range(0, max(len(df_part), 1), chunk_size):
+                        df_chunk: DataFrame = identifiers.unpack_identifiers(
+                            df_part.iloc[start : start + chunk_size]
+                        )
+                        df_chunk.to_sql(
+                            table_name,
+                            con=engine,
+                            if_exists="replace" if is_first_chunk else "append",
+                            dtype=column_types,
+                            index=False,
+                        )
+                        is_first_chunk = False
             except exc.InternalError as e:
                 print(e)
 
+    def __copy_to_db(
+        self,
+        engine: Engine,
+        dfs: Iterable[DataFrame],
+        table_name: str,
+        column_types: Dict = None,
+    ):
+        """
+        Create the table (same column types as df.to_sql) and fill it with COPY, in
+        chunks of _UPLOAD_CHUNK_SIZE rows. The packed uuids are written as strings.
+        The columns that are not in column_types take the type inferred from the first
+        chunk, so a later chunk that would infer another type (floats in a column of
+        integers, or values in a column that was all-NA in the first chunk) raises a
+        ValueError: set its type in column_types.
+
+        * Parameters:
+            - engine: Engine
+            - dfs: Iterable of Dataframes -> At least one.
+            - table_name: string
+            - column_types: Dict
+        """
+        start: float = time.perf_counter()
+        df_chunks: Iterator[DataFrame] = (
+            identifiers.unpack_identifiers(
+                df_part.iloc[row : row + self._UPLOAD_CHUNK_SIZE], is_text=True
+            )
+            for df_part in dfs
+            for row in range(0, max(len(df_part), 1), self._UPLOAD_CHUNK_SIZE)
+        )
+        first_chunk: DataFrame = next(df_chunks)
+        create_query: str = pd.io.sql.get_schema(
+            first_chunk, table_name, con=engine, dtype=column_types
+        )
+        # Not commit_db, which only prints the errors: the COPY would fail later with
+        # an unrelated error.
+        with engine.begin() as connection:
+            connection.execute(text(create_query))
+
+        rows: int = pg_copy.write_dataframes(
+            engine,
+            table_name,
+            self.__check_column_types(
+                itertools.chain([first_chunk], df_chunks),
+                create_query,
+                table_name,
+                engine,
+                column_types,
+            ),
+        )
+        elapsed: float = time.perf_counter() - start
+        print(
+            f"{rows} rows copied to {table_name} in {elapsed:.2f}s ({rows / elapsed:,.0f} rows/s)"
+        )
+
+    def __check_column_types(
+        self,
+        df_chunks: Iterable[DataFrame],
+        create_query: str,
+        table_name: str,
+        engine: Engine,
+        column_types: Dict = None,
+    ) -> Iterator[DataFrame]:
+        """
+        Yield the chunks, checking that their inferred column types are the ones of the
+        table (create_query).
+
+        * Parameters:
+            - df_chunks: Iterable of Dataframes
+            - create_query: string -> CREATE TABLE of the first chunk.
+            - table_name: string
+            - engine: Engine
+            - column_types: Dict
+        """
+        columns: List[str] = create_query.splitlines()
+        for df_chunk in df_chunks:
+            # The types of an empty chunk are not inferred from values, and it is not copied.
+            if not df_chunk.empty:
+                chunk_columns: List[str] = pd.io.sql.get_schema(
+                    df_chunk, table_name, con=engine, dtype=column_types
+                ).splitlines()
+                different_columns: List[str] = [
+                    column.strip(" \t,")
+                    for column, table_column in zip(chunk_columns, columns)
+                    if column != table_column
+                ]
+                if different_columns or len(chunk_columns) != len(columns):
+                    raise ValueError(
+                        f"A chunk of {table_name} has other column types than the first one: {different_columns}! Set them in column_types."
+                    )
+            yield df_chunk
+
     def add_primary_key_on_column(self, table_name: str, column_name: str):
         """
         * Parameters:
@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Iterable, Iterator, Union
+
+
+class HttpCache:
+    """
+    On-disk cache of HTTP responses. Each entry is keyed by the url and the hash of the
+    api key, and keeps the body with its ETag and Last-Modified headers, so the next
+    request can be sent as a conditional GET.
+
+    Files of each entry:
+        - {key}.body: response body
+        - {key}.json: url, etag, last_modified and stored_at (timestamp)
+    """
+
+    def __init__(self, directory: str):
+        """
+        * Parameters:
+            - directory: string
+        """
+        self.directory: str = directory
+
+    def _key(self, url: str, api_key: str) -> str:
+        """
+        * Parameters:
+            - url: string
+            - api_key: string
+        """
+        api_key_hash: str = hashlib.sha256(str(api_key).encode()).hexdigest()
+        return hashlib.sha256(f"{url}\n{api_key_hash}".encode()).hexdigest()
+
+    def _path(self, key: str, extension: str) -> str:
+        """
+        * Parameters:
+            - key: string
+            - extension: string
+        """
+        return os.path.join(self.directory, f"{key}.{extension}")
+
+    def _write(self, path: str, content: bytes) -> None:
+        """
+        Write the file atomically, so a failed run never leaves a truncated entry.
+
+        * Parameters:
+            - path: string
+            - content: bytes
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        temporary_path: str = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(content)
+        os.replace(temporary_path, path)
+
+    def get(self, url: str, api_key: str, with_body: bool = True) -> Union[Dict, None]:
+        """
+        Return the cached entry (url, etag, last_modified, stored_at and body) or None.
+
+        * Parameters:
+            - url: string
+            - api_key: string
+            - with_body: boolean -> If this option is False, the body is not read (see iter_body).
+        """
+        key: str = self._key(url, api_key)
+        try:
+            with open(self._path(key, "json"), "r") as file:
+                entry: Dict = json.load(file)
+            if with_body:
+                with open(self._path(key, "body"), "rb") as file:
+                    entry["body"] = file.read()
+            elif not os.path.exists(self._path(key, "body")):
+                return None
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return entry
+
+    def iter_body(
+        self, url: str, api_key: str, chunk_size: int = 1024 * 1024
+    ) -> Iterator[bytes]:
+        """
+        Read the cached body in chunks.
+
+        * Parameters:
+            - url: string
+            - api_key: string
+            - chunk_size: integer
+        """
+        with open(self._path(self._key(url, api_key), "body"), "rb") as file:
+            for chunk in iter(lambda: file.read(chunk_size), b""):
+                yield chunk
+
+    def put(
+        self,
+        url: str,
+        api_key: str,
+        body: bytes,
+        etag: str = None,
+        last_modified: str = None,
+    ) -> None:
+        """
+        * Parameters:
+            - url: string
+            - api_key: string
+            - body: bytes
+            - etag: string
+            - last_modified: string
+        """
+        key: str = self._key(url, api_key)
+        entry: Dict = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time(),
+        }
+        self._write(self._path(key, "body"), body)
+        self._write(self._path(key, "json"), json.dumps(entry).encode())
+
+    def put_stream(
+        self,
+        url: str,
+        api_key: str,
+        chunks: Iterable[bytes],
+        etag: str = None,
+        last_modified: str = None,
+    ) -> Iterator[bytes]:
+        """
+        Yield the chunks of the body while they are written to the cache. The entry is
+        only stored when all the chunks were read.
+
+        * Parameters:
+            - url: string
+            - api_key: string
+            - chunks: Iterable of bytes
+            - etag: string
+            - last_modified: string
+        """
+        key: str = self._key(url, api_key)
+        os.makedirs(self.directory, exist_ok=True)
+        path: str = self._path(key, "body")
+        temporary_path: str = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, "wb") as file:
+                for chunk in chunks:
+                    file.write(chunk)
+                    yield chunk
+            os.replace(temporary_path, path)
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+        entry: Dict = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time(),
+        }
+        self._write(self._path(key, "json"), json.dumps(entry).encode())
+
+    def touch(self, url: str, api_key: str) -> None:
+        """
+        Mark the cached entry as fresh (after a 304 Not Modified response).
+
+        * Parameters:
+            - url: string
+            - api_key: string
+        """
+        entry: Union[Dict, None] = self.get(url, api_key, with_body=False)
+        if entry is None:
+            return
+        entry["stored_at"] = time.time()
+        self._write(
+            self._path(self._key(url, api_key), "json"), json.dumps(entry).encode()
+        )
@@ -0,0 +1,206 @@
+"""
+Compact representations of the identifiers of the cleaned Dataframes.
+
+- uuid: two uint64 columns, {column}_hi and {column}_lo (16 bytes per row instead of
+  a python string or uuid.UUID object).
+- card number: nullable integer column (Int64, which holds the 19 digits card numbers).
+- codes repeated in many rows (store_code and product_code of the orders): Categorical.
+"""
+
+from typing import List, Tuple
+import uuid
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Series
+
+_SUFFIX_HI = "_hi"
+_SUFFIX_LO = "_lo"
+_REGEX_HEX_UUID = r"[0-9a-fA-F]{32}"
+
+# Value of each hexadecimal character, indexed by its ASCII code.
+_HEX_VALUES = np.zeros(256, dtype=np.uint64)
+_HEX_VALUES[np.frombuffer(b"0123456789", dtype=np.uint8)] = np.arange(10)
+_HEX_VALUES[np.frombuffer(b"abcdef", dtype=np.uint8)] = np.arange(10, 16)
+_HEX_VALUES[np.frombuffer(b"ABCDEF", dtype=np.uint8)] = np.arange(10, 16)
+_NIBBLE_SHIFTS = np.arange(60, -4, -4, dtype=np.uint64)
+_HEX_CHARACTERS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+
+
+def pack_uuids(column: Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert a column of uuid strings (or uuid.UUID objects) to two uint64 arrays,
+    with the 64 high and 64 low bits of each uuid. Values that are not uuids are
+    replaced by random uuids.
+
+    * Parameters:
+        - column: Series
+    """
+    hex_strings: Series = column.map(str).str.replace("-", "", regex=False)
+    is_hex: np.ndarray = hex_strings.str.fullmatch(_REGEX_HEX_UUID).to_numpy(dtype=bool)
+    hi: np.ndarray = np.zeros(len(column), dtype=np.uint64)
+    lo: np.ndarray = np.zeros(len(column), dtype=np.uint64)
+
+    if is_hex.any():
+        characters: np.ndarray = np.frombuffer(
+            "".join(hex_strings[is_hex]).encode("ascii"), dtype=np.uint8
+        ).reshape(-1, 32)
+        nibbles: np.ndarray = _HEX_VALUES[characters]
+        hi[is_hex] = np.bitwise_or.reduce(nibbles[:, :16] << _NIBBLE_SHIFTS, axis=1)
+        lo[is_hex] = np.bitwise_or.reduce(nibbles[:, 16:] << _NIBBLE_SHIFTS, axis=1)
+
+    # Other formats accepted by uuid.UUID ("{...}", "urn:uuid:..."). The packed
+    # columns can not hold a null, so the values that are not uuids (None, for
+    # instance) receive a new random uuid, as the clean_uuid methods do.
+    invalid_values: List = []
+    for position in np.flatnonzero(~is_hex):
+        value = column.iloc[position]
+        try:
+            number: int = uuid.UUID(str(value)).int
+        except ValueError:
+            invalid_values.append(value)
+            number = uuid.uuid4().int
+        hi[position] = number >> 64
+        lo[position] = number & 0xFFFFFFFFFFFFFFFF
+
+    if invalid_values:
+        print(
+            f"The column '{column.name}' has {len(invalid_values)} values that are not uuids (replaced by random uuids): {invalid_values[:5]}"
+        )
+    return hi, lo
+
+
+def unpack_uuids(hi: Series, lo: Series) -> Series:
+    """
+    Convert the two uint64 columns back to a column of uuid.UUID objects.
+
+    * Parameters:
+        - hi: Series
+        - lo: Series
+    """
+    return Series(
+        [
+            uuid.UUID(int=(int(high) << 64) | int(low))
+            for high, low in zip(hi.to_numpy(), lo.to_numpy())
+        ],
+        index=hi.index,
+        dtype=object,
+    )
+
+
+def format_uuids(hi: Series, lo: Series) -> Series:
+    """
+    Convert the two uint64 columns to a column of 32 hexadecimal characters strings
+    (without dashes, which is also a valid Postgres uuid), without uuid.UUID objects.
+
+    * Parameters:
+        - hi: Series
+        - lo: Series
+    """
+    halves: np.ndarray = np.stack([hi.to_numpy(), lo.to_numpy()], axis=1)
+    nibbles: np.ndarray = (halves[:, :, np.newaxis] >> _NIBBLE_SHIFTS) & np.uint64(15)
+    characters: np.ndarray = _HEX_CHARACTERS[nibbles.reshape(len(hi), 32)]
+    return Series(
+        np.ascontiguousarray(characters).view("S32").ravel().astype(str),
+        index=hi.index,
+        dtype=object,
+    )
+
+
+def pack_integers(column: Series) -> Series:
+    """
+    Convert a column of integers (or None) to a nullable integer column (Int64).
+    A value that is not an integer (or does not fit in Int64) raises a ValueError.
+
+    * Parameters:
+        - column: Series
+    """
+    values: List = [None if pd.isna(value) else value for value in column]
+    try:
+        return Series(pd.array(values, dtype="Int64"), index=column.index)
+    except (OverflowError, TypeError, ValueError) as e:
+        raise ValueError(
+            f"The column '{column.name}' could not be converted to Int64: {e}"
+        ) from e
+
+
+def pack_identifiers(
+    df: DataFrame,
+    uuid_columns: List[str],
+    integer_columns: List[str],
+    category_columns: List[str] = (),
+) -> DataFrame:
+    """
+    Replace each uuid column by its {column}_hi and {column}_lo uint64 columns
+    (in the same position), the integer columns by nullable integers and the
+    category columns by Categoricals.
+
+    * Parameters:
+        - df: Dataframe
+        - uuid_columns: List of strings
+        - integer_columns: List of strings
+        - category_columns: List of strings
+    """
+    df = df.copy()
+    for column in integer_columns:
+        if column in df.columns:
+            df[column] = pack_integers(df[column])
+
+    for column in category_columns:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+
+    for column in uuid_columns:
+        if column not in df.columns:
+            continue
+        hi, lo = pack_uuids(df[column])
+        position: int = df.columns.get_loc(column)
+        df = df.drop(columns=[column])
+        df.insert(position, f"{column}{_SUFFIX_HI}", hi)
+        df.insert(position + 1, f"{column}{_SUFFIX_LO}", lo)
+
+    return df
+
+
+def packed_uuid_columns(df: DataFrame) -> List[str]:
+    """
+    Names of the uuid columns packed by pack_identifiers.
+
+    * Parameters:
+        - df: Dataframe
+    """
+    return [
+        column[: -len(_SUFFIX_HI)]
+        for column in df.columns
+        if isinstance(column, str)
+        and column.endswith(_SUFFIX_HI)
+        and f"{column[: -len(_SUFFIX_HI)]}{_SUFFIX_LO}" in df.columns
+        and df[column].dtype == np.uint64
+    ]
+
+
+def unpack_identifiers(df: DataFrame, is_text: bool = False) -> DataFrame:
+    """
+    Replace the packed uuid columns by uuid.UUID objects, which is the type
+    expected by sqlalchemy UUID columns. Nullable integers are kept.
+
+    * Parameters:
+        - df: Dataframe
+        - is_text: boolean -> If this option is True, the uuids are hexadecimal strings (see format_uuids).
+    """
+    columns: List[str] = packed_uuid_columns(df)
+    if not columns:
+        return df
+
+    df = df.copy()
+    for column in columns:
+        hi_column: str = f"{column}{_SUFFIX_HI}"
+        lo_column: str = f"{column}{_SUFFIX_LO}"
+        position: int = df.columns.get_loc(hi_column)
+        uuids: Series = (format_uuids if is_text else unpack_uuids)(
+            df[hi_column], df[lo_column]
+        )
+        df = df.drop(columns=[hi_column, lo_column])
+        df.insert(position, column, uuids)
+
+    return df
@@ -0,0 +1,214 @@
+"""
+Incremental parser of JSON documents into Dataframes.
+
+The body is read chunk by chunk and each column (or record) is converted as soon as
+it is parsed, so the raw bytes, the parsed dictionaries and the Dataframe are never in
+memory at the same time. The result is the same Dataframe as pd.DataFrame.from_records(json.loads(body)).
+
+Layouts:
+    - {"column": {"index": value, ...}, ...} (date_details.json): one list per column.
+    - [{"column": value, ...}, ...]: list of records.
+"""
+
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+import pandas as pd
+from pandas import DataFrame
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARACTERS = "0123456789.eE+-"
+_CLOSING_CHARACTERS = {"{": "}", "[": "]"}
+
+
+class _Reader:
+    """
+    Buffer of the decoded text, refilled from the chunks when a value is incomplete.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self.__chunks: Iterator[bytes] = iter(chunks)
+        self.__decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__buffer: str = ""
+        self.__position: int = 0
+        self.__is_exhausted: bool = False
+
+    def __fill(self) -> bool:
+        """
+        Append chunks to the buffer until its size doubles (so a value parsed again
+        after each fill is parsed a logarithmic number of times).
+        Return False if there are no more chunks.
+        """
+        if self.__is_exhausted:
+            return False
+        texts: List[str] = [self.__buffer[self.__position :]]
+        size: int = 0
+        minimum_size: int = max(len(texts[0]), 1)
+        while size < minimum_size:
+            try:
+                text: str = self.__decoder.decode(next(self.__chunks))
+            except StopIteration:
+                self.__is_exhausted = True
+                texts.append(self.__decoder.decode(b"", final=True))
+                break
+            texts.append(text)
+            size += len(text)
+        self.__buffer = "".join(texts)
+        self.__position = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        Return the next character that is not a whitespace, without consuming it.
+        """
+        while True:
+            while (
+                self.__position < len(self.__buffer)
+                and self.__buffer[self.__position] in _WHITESPACE
+            ):
+                self.__position += 1
+            if self.__position < len(self.__buffer):
+                return self.__buffer[self.__position]
+            if not self.__fill():
+                return ""
+
+    def expect(self, character: str) -> None:
+        """
+        * Parameters:
+            - character: string
+        """
+        if self.peek() != character:
+            raise json.JSONDecodeError(
+                f"Expecting '{character}'", self.__buffer, self.__position
+            )
+        self.__position += 1
+
+    def expect_end(self) -> None:
+        """
+        Check that there is nothing but whitespaces after the position.
+        """
+        if self.peek() != "":
+            raise json.JSONDecodeError("Extra data", self.__buffer, self.__position)
+
+    def value(self) -> Any:
+        """
+        Parse the next JSON value.
+        An object (or array) is only parsed when the buffer has a closing character
+        after it, and a number is parsed again if it can continue in the next chunk
+        ("1." of "1.5"). Strings with a closing character ("}") make it try again.
+        """
+        closing: Union[str, None] = _CLOSING_CHARACTERS.get(self.peek())
+        # Characters after the position already searched for the closing character.
+        searched: int = 0
+        while True:
+            if closing is not None and not self.__is_exhausted:
+                found: int = self.__buffer.find(closing, self.__position + searched)
+                if found == -1:
+                    searched = len(self.__buffer) - self.__position
+                    self.__fill()
+                    continue
+                searched = found + 1 - self.__position
+            try:
+                value, end = _DECODER.raw_decode(self.__buffer, self.__position)
+                is_complete: bool = not (
+                    type(value) in (int, float)
+                    and (
+                        end == len(self.__buffer)
+                        or self.__buffer[end] in _NUMBER_CHARACTERS
+                    )
+                )
+                if is_complete or self.__is_exhausted:
+                    self.__position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.__is_exhausted:
+                    raise
+            if closing is None:
+                self.__fill()
+
+
+def _read_columns(reader: _Reader) -> DataFrame:
+    """
+    Parse {"column": {"index": value, ...}, ...} into a Dataframe.
+    Each column is parsed (by the C decoder of json) and converted to a list before
+    the next one is read, so only one column dictionary is in memory at a time.
+
+    * Parameters:
+        - reader: _Reader
+    """
+    columns: Dict[str, List[Any]] = {}
+    columns_keys: Dict[str, List[str]] = {}
+    first_keys: List[str] = None
+    others: Dict[str, Any] = {}
+
+    reader.expect("{")
+    while reader.peek() != "}":
+        column: str = reader.value()
+        reader.expect(":")
+        value: Any = reader.value()
+        if isinstance(value, dict):
+            keys: List[str] = list(value)
+            if first_keys is None:
+                first_keys = keys
+            # The index of most columns is the same, so it is kept only once.
+            columns_keys[column] = first_keys if keys == first_keys else keys
+            # Repeated strings ("Evening", "2012") share one object, as the Dataframe
+            # only needs equal values.
+            strings: Dict[str, str] = {}
+            columns[column] = [
+                strings.setdefault(item, item) if type(item) is str else item
+                for item in value.values()
+            ]
+        else:
+            others[column] = value
+        del value
+        if reader.peek() == ",":
+            reader.expect(",")
+    reader.expect("}")
+
+    if (
+        not others
+        and columns
+        and all(keys is first_keys for keys in columns_keys.values())
+    ):
+        return DataFrame(
+            {column: columns[column] for column in sorted(columns)},
+            index=pd.Index(first_keys),
+        )
+
+    # Different indexes (or values that are not objects): pandas aligns them.
+    data: Dict[str, Any] = {
+        column: dict(zip(columns_keys[column], columns[column])) for column in columns
+    }
+    data.update(others)
+    return DataFrame.from_records(data)
+
+
+def read_dataframe(chunks: Iterable[bytes]) -> DataFrame:
+    """
+    Parse the JSON body, given in chunks of bytes, into a Dataframe.
+
+    * Parameters:
+        - chunks: Iterable of bytes
+    """
+    reader: _Reader = _Reader(chunks)
+    if reader.peek() == "{":
+        df: DataFrame = _read_columns(reader)
+    elif reader.peek() == "[":
+        records: List[Any] = []
+        reader.expect("[")
+        while reader.peek() != "]":
+            records.append(reader.value())
+            if reader.peek() == ",":
+                reader.expect(",")
+        reader.expect("]")
+        df = DataFrame.from_records(records)
+    else:
+        df = DataFrame.from_records(reader.value())
+
+    # As json.loads, the document must end after the value (it also reads the last
+    # chunks, so a cache written while the body is read is complete).
+    reader.expect_end()
+    return df
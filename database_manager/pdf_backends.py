@@ -0,0 +1,111 @@
+"""
+Backends that extract the tables of pdf documents, one Dataframe per table.
+
+- tabula: tabula-py, which runs tabula-java (it starts a Java VM).
+- pdfplumber: pure python, no Java VM.
+
+Both return the same layout: the first row of each table is the header, and the
+cells are parsed with pd.read_csv (as tabula does), so the column types match.
+"""
+
+import csv
+import io
+from typing import Callable, Dict, List, Union
+
+import pandas as pd
+from pandas import DataFrame
+
+try:
+    import tabula
+except ImportError:
+    tabula = None
+
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+DEFAULT_BACKEND = "tabula"
+# Tables without ruling lines are detected by the alignment of the words.
+_PDFPLUMBER_TEXT_SETTINGS: Dict = {
+    "vertical_strategy": "text",
+    "horizontal_strategy": "text",
+}
+
+
+def _read_tabula(pdf_path: str, pages: Union[str, List[int]]) -> List[DataFrame]:
+    """
+    * Parameters:
+        - pdf_path: string
+        - pages: "all" or List of integers (starting at 1)
+    """
+    return tabula.read_pdf(pdf_path, pages=pages)
+
+
+def _table_to_dataframe(table: List[List[str]]) -> DataFrame:
+    """
+    Parse the rows of a table (the first one is the header) like tabula does.
+
+    * Parameters:
+        - table: List of rows
+    """
+    buffer: io.StringIO = io.StringIO()
+    csv.writer(buffer).writerows(
+        [["" if cell is None else cell for cell in row] for row in table]
+    )
+    buffer.seek(0)
+    return pd.read_csv(buffer)
+
+
+def _read_pdfplumber(pdf_path: str, pages: Union[str, List[int]]) -> List[DataFrame]:
+    """
+    * Parameters:
+        - pdf_path: string
+        - pages: "all" or List of integers (starting at 1)
+    """
+    dfs: List[DataFrame] = []
+    with pdfplumber.open(pdf_path) as pdf:
+        page_numbers: List[int] = (
+            list(range(1, len(pdf.pages) + 1)) if pages == "all" else list(pages)
+        )
+        for page_number in page_numbers:
+            page = pdf.pages[page_number - 1]
+            tables: List[List[List[str]]] = page.extract_tables()
+            if not tables:
+                tables = page.extract_tables(_PDFPLUMBER_TEXT_SETTINGS)
+            dfs.extend(_table_to_dataframe(table) for table in tables if len(table) > 1)
+    return dfs
+
+
+_BACKENDS: Dict[str, Callable] = {
+    "tabula": _read_tabula,
+    "pdfplumber": _read_pdfplumber,
+}
+
+
+def available_backends() -> List[str]:
+    """
+    Names of the backends whose package is installed.
+    """
+    modules: Dict = {"tabula": tabula, "pdfplumber": pdfplumber}
+    return [name for name in _BACKENDS if modules[name] is not None]
+
+
+def read_pdf(
+    pdf_path: str, pages: Union[str, List[int]] = "all", backend: str = DEFAULT_BACKEND
+) -> List[DataFrame]:
+    """
+    Extract the tables of the pages, one Dataframe per table, in page order.
+
+    * Parameters:
+        - pdf_path: string
+        - pages: "all" or List of integers (starting at 1)
+        - backend: string -> "tabula" or "pdfplumber"
+    """
+    if backend not in _BACKENDS:
+        raise ValueError(
+            f"The pdf backend '{backend}' does not exist! Use one of {list(_BACKENDS)}."
+        )
+    if backend not in available_backends():
+        raise ImportError(f"The pdf backend '{backend}' is not installed!")
+    return _BACKENDS[backend](pdf_path, pages)
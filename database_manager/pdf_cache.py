@@ -0,0 +1,214 @@
+"""
+Content-addressed cache of the tables extracted from pdf documents.
+
+Each Dataframe is stored as Parquet, named by the sha256 of the pdf bytes, so an
+unchanged pdf is never parsed again. When the cache is bigger than its maximum size,
+the least recently used entries are deleted.
+
+Inspect or purge the cache with:
+    python -m database_manager.pdf_cache inspect [--directory DIRECTORY]
+    python -m database_manager.pdf_cache purge [--directory DIRECTORY] [--key KEY]
+"""
+
+import argparse
+from datetime import datetime
+import hashlib
+import os
+from typing import Dict, List, Union
+
+import pandas as pd
+from pandas import DataFrame
+
+DEFAULT_DIRECTORY = "data/pdf_cache"
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+_EXTENSION = ".parquet"
+_HASH_CHUNK_SIZE = 1024 * 1024
+# Inferred types of the object columns that Parquet can not store as one type.
+_MIXED_TYPES = ["mixed", "mixed-integer", "mixed-integer-float"]
+
+
+def _to_parquet_safe(df: DataFrame) -> DataFrame:
+    """
+    Return the Dataframe with the values of the mixed object columns as strings.
+    The pages of a pdf table are read separately, so a column (card_number, for
+    instance) can mix the integers of the clean pages with the strings of the others.
+    The integer floats (integers of the pages with missing values) are written without
+    decimals, so the cleaning of the cached values is the same.
+
+    * Parameters:
+        - df: Dataframe
+    """
+    mixed_columns: List[str] = [
+        column
+        for column in df.columns
+        if df[column].dtype == object
+        and pd.api.types.infer_dtype(df[column], skipna=True) in _MIXED_TYPES
+    ]
+    if not mixed_columns:
+        return df
+
+    def to_string(value) -> str:
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value)
+
+    df = df.copy()
+    for column in mixed_columns:
+        is_null: pd.Series = df[column].isna()
+        df[column] = df[column].map(to_string).where(~is_null, None)
+    return df
+
+
+class PdfTableCache:
+    """
+    Parquet files of the extracted tables, keyed by the hash of the pdf bytes.
+    """
+
+    def __init__(
+        self, directory: str = DEFAULT_DIRECTORY, max_size: int = DEFAULT_MAX_SIZE
+    ):
+        """
+        * Parameters:
+            - directory: string
+            - max_size: integer -> Maximum size of the cache, in bytes.
+        """
+        self.directory: str = directory
+        self.max_size: int = max_size
+
+    def key(self, pdf_path: str) -> str:
+        """
+        Return the sha256 of the pdf bytes.
+
+        * Parameters:
+            - pdf_path: string
+        """
+        digest = hashlib.sha256()
+        with open(pdf_path, "rb") as file:
+            for chunk in iter(lambda: file.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        """
+        * Parameters:
+            - key: string
+        """
+        return os.path.join(self.directory, f"{key}{_EXTENSION}")
+
+    def get(self, key: str) -> Union[DataFrame, None]:
+        """
+        Return the cached Dataframe or None.
+
+        * Parameters:
+            - key: string
+        """
+        path: str = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            df: DataFrame = pd.read_parquet(path)
+        except (ImportError, OSError, ValueError) as e:
+            print(f"The cached tables {key} could not be read: {e}")
+            return None
+        # The modification time is the last use of the entry (least recently used eviction).
+        os.utime(path)
+        return df
+
+    def put(self, key: str, df: DataFrame) -> None:
+        """
+        Store the Dataframe and evict the least recently used entries if the cache is
+        bigger than max_size. The values of the mixed object columns are stored as
+        strings (see _to_parquet_safe).
+
+        * Parameters:
+            - key: string
+            - df: Dataframe
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path: str = self._path(key)
+        temporary_path: str = f"{path}.{os.getpid()}.tmp"
+        try:
+            _to_parquet_safe(df).to_parquet(temporary_path)
+        except (ImportError, ValueError, TypeError) as e:
+            print(f"The tables {key} could not be cached: {e}")
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            return
+        os.replace(temporary_path, path)
+        self.evict()
+
+    def entries(self) -> List[Dict]:
+        """
+        Return key, size (bytes) and last_used (timestamp) of each entry,
+        from the most to the least recently used.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        entries: List[Dict] = []
+        for filename in os.listdir(self.directory):
+            if not filename.endswith(_EXTENSION):
+                continue
+            stat = os.stat(os.path.join(self.directory, filename))
+            entries.append(
+                {
+                    "key": filename[: -len(_EXTENSION)],
+                    "size": stat.st_size,
+                    "last_used": stat.st_mtime,
+                }
+            )
+        return sorted(entries, key=lambda entry: entry["last_used"], reverse=True)
+
+    def evict(self) -> List[str]:
+        """
+        Delete the least recently used entries until the cache fits in max_size.
+        Return the deleted keys.
+        """
+        evicted: List[str] = []
+        total_size: int = 0
+        for entry in self.entries():
+            total_size += entry["size"]
+            if total_size > self.max_size:
+                self.purge(entry["key"])
+                evicted.append(entry["key"])
+        return evicted
+
+    def purge(self, key: str = None) -> int:
+        """
+        Delete one entry, or all of them if key is None. Return the number of deleted entries.
+
+        * Parameters:
+            - key: string
+        """
+        keys: List[str] = (
+            [key] if key is not None else [entry["key"] for entry in self.entries()]
+        )
+        deleted: int = 0
+        for entry_key in keys:
+            path: str = self._path(entry_key)
+            if os.path.exists(path):
+                os.remove(path)
+                deleted += 1
+        return deleted
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Inspect or purge the pdf tables cache."
+    )
+    parser.add_argument("command", choices=["inspect", "purge"])
+    parser.add_argument("--directory", default=DEFAULT_DIRECTORY)
+    parser.add_argument("--key", default=None, help="Purge only this entry.")
+    args = parser.parse_args()
+
+    cache = PdfTableCache(args.directory)
+    if args.command == "inspect":
+        entries: List[Dict] = cache.entries()
+        for entry in entries:
+            last_used: str = datetime.fromtimestamp(entry["last_used"]).isoformat(
+                sep=" ", timespec="seconds"
+            )
+            print(f"{entry['key']}  {entry['size'] / 1024:10.1f} KB  {last_used}")
+        total_size: int = sum(entry["size"] for entry in entries)
+        print(f"{len(entries)} entries, {total_size / 1024:.1f} KB in {args.directory}")
+    else:
+        print(f"{cache.purge(args.key)} entries deleted from {args.directory}")
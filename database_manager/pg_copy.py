@@ -0,0 +1,199 @@
+"""
+Bulk transfers with the PostgreSQL COPY command (psycopg2 copy_expert).
+
+- read_query: COPY (SELECT ...) TO STDOUT as csv, parsed by pyarrow (or pandas) into
+  columns, instead of building a python object per value like pd.read_sql.
+- write_dataframes: COPY ... FROM STDIN in the text format, one buffer per Dataframe,
+  instead of an INSERT per row like df.to_sql.
+"""
+
+import csv
+import io
+import re
+from typing import Iterable, List, Set
+
+import pandas as pd
+from pandas import DataFrame
+from sqlalchemy import Engine, Select
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+# NULL marker of the csv, so NULL and empty strings are different values.
+_NULL = "\\N"
+# Oids of the types read as strings, as pd.read_sql does: char, name, text, bpchar,
+# varchar and uuid. Otherwise, a text column of digits would be parsed as a number.
+_TEXT_TYPE_OIDS = {18, 19, 25, 1042, 1043, 2950}
+# Oids of smallint, integer and bigint. Float columns are rounded into them, as the
+# INSERT of a float does (a float "3.0" is not valid for COPY).
+_INTEGER_TYPE_OIDS = {20, 21, 23}
+# Escapes of the text format of COPY (str.translate table).
+_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+_REGEX_TEXT_ESCAPES = re.compile(r"[\\\t\n\r]")
+
+
+def read_query(engine: Engine, query: Select) -> DataFrame:
+    """
+    Run the query with COPY ... TO STDOUT and return its rows as a Dataframe.
+    Text and uuid columns are strings, NULLs are None (strings) or NaN (numbers),
+    and the other types are inferred from the csv.
+
+    * Parameters:
+        - engine: Engine -> postgresql+psycopg2 engine
+        - query: Select
+    """
+    sql: str = str(
+        query.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True})
+    )
+    buffer: io.BytesIO = io.BytesIO()
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(f"SELECT * FROM ({sql}) AS query LIMIT 0")
+        text_columns: List[str] = [
+            description.name
+            for description in cursor.description
+            if description.type_code in _TEXT_TYPE_OIDS
+        ]
+        cursor.copy_expert(
+            f"COPY ({sql}) TO STDOUT WITH (FORMAT csv, HEADER true, NULL '{_NULL}')",
+            buffer,
+        )
+        cursor.close()
+    finally:
+        connection.close()
+    buffer.seek(0)
+
+    if pa_csv is not None:
+        table = pa_csv.read_csv(
+            buffer,
+            convert_options=pa_csv.ConvertOptions(
+                column_types={column: pa.string() for column in text_columns},
+                null_values=[_NULL],
+                strings_can_be_null=True,
+                true_values=["t"],
+                false_values=["f"],
+            ),
+        )
+        return table.to_pandas()
+
+    df: DataFrame = pd.read_csv(
+        buffer,
+        dtype={column: object for column in text_columns},
+        keep_default_na=False,
+        na_values=[_NULL],
+        true_values=["t"],
+        false_values=["f"],
+    )
+    for column in text_columns:
+        df[column] = df[column].where(df[column].notna(), None)
+    return df
+
+
+def _quote(name: str) -> str:
+    """
+    Quote the identifier, so it is the name created by df.to_sql ("index", "1").
+
+    * Parameters:
+        - name: string
+    """
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _escape_text(value) -> str:
+    """
+    Convert the value to the string of the text format of COPY.
+
+    * Parameters:
+        - value: Any
+    """
+    text: str = str(value)
+    # Most values have nothing to escape, and the search is faster than translate.
+    if _REGEX_TEXT_ESCAPES.search(text) is None:
+        return text
+    return text.translate(_TEXT_ESCAPES)
+
+
+def _to_copy_text(df: DataFrame, integer_columns: Set[str]) -> io.StringIO:
+    """
+    Write the Dataframe in the text format of COPY: tab separated values, NULL as \\N
+    and backslash escapes in the strings (so an empty string is not NULL).
+    Numbers, booleans and dates are written by pandas; the other columns (strings,
+    uuids, Categoricals, date objects) are converted to escaped strings.
+
+    * Parameters:
+        - df: Dataframe
+        - integer_columns: Set of strings -> Columns of integer type in the table.
+    """
+    df = df.copy(deep=False)
+    for column in df.columns:
+        values = df[column]
+        if pd.api.types.is_float_dtype(values) and column in integer_columns:
+            df[column] = values.round().astype("Int64")
+        elif not (
+            pd.api.types.is_numeric_dtype(values)
+            or pd.api.types.is_bool_dtype(values)
+            or pd.api.types.is_datetime64_any_dtype(values)
+        ):
+            values = values.astype(object)
+            is_value = values.notna()
+            df[column] = values[is_value].map(_escape_text).reindex(values.index)
+
+    buffer: io.StringIO = io.StringIO()
+    df.to_csv(
+        buffer,
+        sep="\t",
+        header=False,
+        index=False,
+        na_rep=_NULL,
+        quoting=csv.QUOTE_NONE,
+        # The strings are already escaped, so nothing is quoted.
+        quotechar="\0",
+        lineterminator="\n",
+    )
+    buffer.seek(0)
+    return buffer
+
+
+def write_dataframes(engine: Engine, table_name: str, dfs: Iterable[DataFrame]) -> int:
+    """
+    Append the Dataframes to the existing table with COPY ... FROM STDIN, in one
+    transaction. Only one Dataframe is converted to text at a time, so the memory is
+    bounded by the size of the chunks. Return the number of rows.
+
+    * Parameters:
+        - engine: Engine -> postgresql+psycopg2 engine
+        - table_name: string
+        - dfs: Iterable of Dataframes -> Their columns must be in the table.
+    """
+    rows: int = 0
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(f"SELECT * FROM {_quote(table_name)} LIMIT 0")
+        integer_columns: Set[str] = {
+            description.name
+            for description in cursor.description
+            if description.type_code in _INTEGER_TYPE_OIDS
+        }
+        for df in dfs:
+            if df.empty:
+                continue
+            columns: str = ", ".join(_quote(column) for column in df.columns)
+            cursor.copy_expert(
+                f"COPY {_quote(table_name)} ({columns}) FROM STDIN",
+                _to_copy_text(df, integer_columns),
+            )
+            rows += len(df)
+        cursor.close()
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+    return rows
@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+import math
+from typing import Any, List, Sequence
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    column,
+    func,
+    literal_column,
+    select,
+    table,
+    true,
+)
+
+
+@dataclass(frozen=True)
+class RangeFilter:
+    """
+    Filter of the rows whose column is in the range [start, end), pushed into the
+    generated sql. It can be a key range (the index column) or a watermark (rows of a
+    date column after the last load, for instance).
+
+    * Attributes:
+        - column: string
+        - start: Any -> Minimum value (included). If it is None, there is no minimum.
+        - end: Any -> Maximum value (excluded). If it is None, there is no maximum.
+    """
+
+    column: str
+    start: Any = None
+    end: Any = None
+
+    def to_clause(self) -> ColumnElement:
+        """
+        Return the sql condition, with the values as bound parameters.
+        """
+        conditions: List[ColumnElement] = []
+        if self.start is not None:
+            conditions.append(column(self.column) >= self.start)
+        if self.end is not None:
+            conditions.append(column(self.column) < self.end)
+        return and_(*conditions) if conditions else true()
+
+
+def select_query(
+    table_name: str, columns: List[str] = None, filters: Sequence[RangeFilter] = ()
+) -> Select:
+    """
+    Build "SELECT {columns} FROM {table_name} WHERE {filters}".
+    The names are quoted when needed ("1", for instance).
+
+    * Parameters:
+        - table_name: string -> It can have the schema ("public.orders_table").
+        - columns: List of strings -> If it is None, all the columns are selected.
+        - filters: List of RangeFilter
+    """
+    schema, _, name = table_name.rpartition(".")
+    query: Select = select(
+        *(
+            [column(column_name) for column_name in columns]
+            if columns
+            else [literal_column("*")]
+        )
+    ).select_from(table(name, schema=schema or None))
+    for row_filter in filters:
+        query = query.where(row_filter.to_clause())
+    return query
+
+
+def key_bounds_query(
+    table_name: str, key: str, filters: Sequence[RangeFilter] = ()
+) -> Select:
+    """
+    Build "SELECT min({key}), max({key}) FROM {table_name} WHERE {filters}".
+
+    * Parameters:
+        - table_name: string
+        - key: string
+        - filters: List of RangeFilter
+    """
+    schema, _, name = table_name.rpartition(".")
+    query: Select = select(func.min(column(key)), func.max(column(key))).select_from(
+        table(name, schema=schema or None)
+    )
+    for row_filter in filters:
+        query = query.where(row_filter.to_clause())
+    return query
+
+
+def split_key_range(
+    key: str, minimum: int, maximum: int, partitions: int
+) -> List[RangeFilter]:
+    """
+    Split the integer keys [minimum, maximum] in ranges of the same length.
+
+    * Parameters:
+        - key: string
+        - minimum: integer
+        - maximum: integer
+        - partitions: integer
+    """
+    step: int = max(1, math.ceil((maximum - minimum + 1) / partitions))
+    return [
+        RangeFilter(key, start, min(start + step, maximum + 1))
+        for start in range(minimum, maximum + 1, step)
+    ]
@@ -0,0 +1,227 @@
+"""
+Batched string operations used by the column versions of the clean_* methods.
+
+Each function receives a whole column and returns a column with the same index.
+When pyarrow is installed and the column only has strings (or nulls), the
+regular expressions run in Arrow compute, which does not hold the GIL per element.
+Otherwise, the pandas string methods are used.
+"""
+
+import re
+from typing import Iterable, List, Match, Pattern, Union
+
+import pandas as pd
+from pandas import Series
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+
+# Character classes that match non ASCII characters in python but not in Arrow (RE2).
+_UNICODE_CLASSES = re.compile(r"\\[wWdDsSbB]")
+_REGEX_REPEATED_CHARACTERS = r"((\w)\2{1,})"
+
+
+def _pattern_string(pattern: Union[str, Pattern]) -> str:
+    """
+    * Parameters:
+        - pattern: string|Pattern
+    """
+    return pattern.pattern if isinstance(pattern, re.Pattern) else pattern
+
+
+def _re2_pattern(pattern: Union[str, Pattern], is_match: bool) -> Union[str, None]:
+    """
+    Return the pattern that runs in Arrow (RE2) with the result of python, or None.
+    The python $ also matches before a newline at the end of the string, but the RE2 $
+    does not. To check a match, each $ anchor becomes \\n?$, which matches the same
+    strings. A replacement would remove that newline, so it returns None.
+
+    * Parameters:
+        - pattern: string|Pattern
+        - is_match: boolean -> If this option is False, the pattern is used to replace.
+    """
+    pattern_string: str = _pattern_string(pattern)
+    parts: List[str] = []
+    is_class: bool = False
+    position: int = 0
+    while position < len(pattern_string):
+        character: str = pattern_string[position]
+        if character == "\\":
+            parts.append(pattern_string[position : position + 2])
+            position += 2
+            continue
+        if character == "[" and not is_class:
+            # A ] right after [ or [^ is a character of the class.
+            is_class = True
+            opening: Match = re.match(r"\[\^?\]?", pattern_string[position:])
+            parts.append(opening.group())
+            position += len(opening.group())
+            continue
+        if character == "]" and is_class:
+            is_class = False
+        elif character == "$" and not is_class:
+            if not is_match:
+                return None
+            character = r"\n?$"
+        parts.append(character)
+        position += 1
+    return "".join(parts)
+
+
+def _to_arrow(column: Series, pattern: Union[str, Pattern]):
+    """
+    Convert the column to an Arrow string array if the pattern can run in Arrow with the
+    same result as in python (flags and character classes). Otherwise, return None.
+    Syntax that RE2 does not support (backreferences, lookarounds) is only detected
+    when the pattern runs, so contains and replace also fall back on pa.ArrowInvalid.
+    The $ anchors are handled by _re2_pattern.
+
+    * Parameters:
+        - column: Series
+        - pattern: string|Pattern
+    """
+    if pa is None:
+        return None
+    if isinstance(pattern, re.Pattern) and pattern.flags & ~re.UNICODE:
+        return None
+    try:
+        array = pa.array(column, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+
+    if _UNICODE_CLASSES.search(_pattern_string(pattern)):
+        if not pc.all(pc.string_is_ascii(array)).as_py():
+            return None
+    return array
+
+
+def is_string(column: Series) -> Series:
+    """
+    Check which values are python strings.
+
+    * Parameters:
+        - column: Series
+    """
+    if not pd.api.types.is_object_dtype(column) and not pd.api.types.is_string_dtype(
+        column
+    ):
+        return Series(False, index=column.index)
+    # Strings and missing values (the common case) are checked without a python loop.
+    if pd.api.types.infer_dtype(column, skipna=True) == "string":
+        return column.notna()
+    return column.map(lambda value: isinstance(value, str))
+
+
+def is_null_token(column: Series, tokens: Iterable[str]) -> Series:
+    """
+    Check which values are null or one of the tokens ("NULL", "N/A", for instance).
+
+    * Parameters:
+        - column: Series
+        - tokens: List of strings
+    """
+    return column.isna() | column.isin(list(tokens))
+
+
+def contains(column: Series, pattern: Union[str, Pattern]) -> Series:
+    """
+    Check which values have a match of the regular expression (like re.search).
+    Values that are not strings return False.
+
+    * Parameters:
+        - column: Series
+        - pattern: string|Pattern
+    """
+    re2_pattern: Union[str, None] = _re2_pattern(pattern, is_match=True)
+    array = _to_arrow(column, pattern) if re2_pattern is not None else None
+    if array is not None:
+        try:
+            matches = pc.match_substring_regex(array, re2_pattern)
+        except pa.ArrowInvalid:
+            array = None
+    if array is None:
+        strings: Series = column.astype(object).where(is_string(column))
+        return strings.str.contains(pattern, regex=True, na=False).astype(bool)
+
+    return Series(
+        matches.fill_null(False).to_numpy(zero_copy_only=False), index=column.index
+    )
+
+
+def has_digit(column: Series) -> Series:
+    """
+    Check which values have at least one digit.
+
+    * Parameters:
+        - column: Series
+    """
+    return contains(column, r"\d")
+
+
+def replace(
+    column: Series, pattern: Union[str, Pattern], replacement: str = ""
+) -> Series:
+    """
+    Replace all the matches of the regular expression (like re.sub).
+    Values that are not strings are kept as they are.
+
+    * Parameters:
+        - column: Series
+        - pattern: string|Pattern
+        - replacement: string
+    """
+    re2_pattern: Union[str, None] = _re2_pattern(pattern, is_match=False)
+    array = _to_arrow(column, pattern) if re2_pattern is not None else None
+    if array is not None:
+        try:
+            replaced = pc.replace_substring_regex(array, re2_pattern, replacement)
+        except pa.ArrowInvalid:
+            array = None
+    if array is None:
+        strings: Series = column.astype(object).where(is_string(column))
+        replaced: Series = strings.str.replace(pattern, replacement, regex=True)
+        return replaced.where(strings.notna(), column)
+
+    return Series(
+        replaced.to_numpy(zero_copy_only=False), index=column.index, dtype=object
+    ).where(column.notna(), column)
+
+
+def strip_characters(column: Series, character_class: str) -> Series:
+    """
+    Remove every character of the character class ("[a-zA-Z]", for instance).
+
+    * Parameters:
+        - column: Series
+        - character_class: string
+    """
+    return replace(column, character_class, "")
+
+
+def remove_repeated_characters(column: Series) -> Series:
+    """
+    Remove the sequences of a repeated character ("eeEurope" becomes "Europe").
+    Arrow (RE2) does not support backreferences, so it always runs in pandas.
+
+    * Parameters:
+        - column: Series
+    """
+    strings: Series = column.astype(object).where(is_string(column))
+    replaced: Series = strings.str.replace(_REGEX_REPEATED_CHARACTERS, "", regex=True)
+    return replaced.where(strings.notna(), column)
+
+
+def has_repeated_characters(column: Series) -> Series:
+    """
+    Check which values have a sequence of a repeated character.
+
+    * Parameters:
+        - column: Series
+    """
+    strings: Series = column.astype(object).where(is_string(column))
+    return strings.notna() & (remove_repeated_characters(strings) != strings)
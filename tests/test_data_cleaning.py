@@ -0,0 +1,345 @@
+from datetime import date
+import uuid
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from database_manager.data_cleaning import DataCleaning
+from database_manager.data_extraction import DataExtractor
+
+UUID_PREFIX = "a0eebc99-9c0b-4ef8-bb6d-6bb9bd380a1"
+INVALID_UUID = "zzzzzzzz-zzzz-zzzz-zzzz-zzzzzzzzzzzz"
+
+
+def normalize(df: DataFrame, columns: List[str]) -> DataFrame:
+    """
+    Values of the columns as objects, with every missing value (None, NaN, NA) as None.
+
+    * Parameters:
+        - df: Dataframe
+        - columns: List of strings
+    """
+    values: DataFrame = df[columns].astype(object)
+    return values.where(values.notna(), None).reset_index(drop=True)
+
+
+def assert_same_uuids(expected: pd.Series, actual: pd.Series, raw: pd.Series) -> None:
+    """
+    The valid uuids are kept and the invalid ones are replaced (by random uuids) in both.
+
+    * Parameters:
+        - expected: Series
+        - actual: Series
+        - raw: Series -> Values before the cleaning.
+    """
+    is_kept: pd.Series = expected.reset_index(drop=True) == raw.reset_index(drop=True)
+    assert (
+        actual.reset_index(drop=True)[is_kept] == raw.reset_index(drop=True)[is_kept]
+    ).all()
+    for value in actual.reset_index(drop=True)[~is_kept]:
+        assert isinstance(value, uuid.UUID)
+
+
+@pytest.fixture
+def users() -> DataFrame:
+    return pd.DataFrame(
+        {
+            "index": range(8),
+            "first_name": ["Ann", "NULL", "R2D2", "", "Bob", "N/A", "Zoé", "Max"],
+            "last_name": [
+                "Lee",
+                "Smith",
+                "NULL",
+                "O'Neil",
+                "3rd",
+                "Li",
+                "Brown",
+                "Doe",
+            ],
+            "date_of_birth": [
+                "1990-05-17",
+                "0001-01-01",
+                "March 1985 12",
+                "1985 March 12",
+                "2001/02/03",
+                "31/12/1999",
+                np.nan,
+                "bad",
+            ],
+            "company": ["Acme", "NULL", "", np.nan, "N/A", "Foo 2", "Bar", "Baz"],
+            "email_address": [
+                "a@b.com",
+                "a@@b.com",
+                "NULL",
+                "x@y.co.uk",
+                "plain",
+                "@@",
+                "b@c.de",
+                "c@d.org",
+            ],
+            "address": ["1 Road", "NULL", np.nan, "", "2 Street", "N/A", "x", "y"],
+            "country": [
+                "Germany",
+                "United Kingdom",
+                "NULL",
+                "GB",
+                "United States",
+                "5GER",
+                "Germany",
+                "Germany",
+            ],
+            "country_code": ["DE", "GB", "US", "GB", "GGB", "US", "DE", "XX"],
+            "phone_number": [
+                "+49 (0) 123-456",
+                "NULL",
+                "(020) 7946.0018",
+                "123",
+                "+1 555 0100",
+                "x1",
+                "0049",
+                "12",
+            ],
+            "join_date": [
+                "2020-01-01",
+                "2020 January 02",
+                "June 2021 03",
+                "0001-01-01",
+                np.nan,
+                "2019/12/31",
+                "nope",
+                "2018-02-30",
+            ],
+            "user_uuid": [
+                f"{UUID_PREFIX}0",
+                f"{UUID_PREFIX}1",
+                INVALID_UUID,
+                np.nan,
+                "bad",
+                f"{UUID_PREFIX}5",
+                f"{UUID_PREFIX}6",
+                f"{UUID_PREFIX}7",
+            ],
+        }
+    )
+
+
+@pytest.fixture
+def data_cleaning(monkeypatch, users: DataFrame) -> DataCleaning:
+    """
+    DataCleaning whose RDS tables are the users fixture.
+    """
+    monkeypatch.setattr(DataExtractor, "read_config", lambda self: {})
+    monkeypatch.setattr(
+        DataExtractor,
+        "read_rds_table",
+        lambda self, db, table_name, columns=None, filters=(), method="read_sql": users[
+            columns
+        ].copy(),
+    )
+    return DataCleaning()
+
+
+def test_clean_user_data_vectorized_matches_rows(
+    data_cleaning: DataCleaning, users: DataFrame
+):
+    vectorized: DataFrame = data_cleaning.clean_user_data(
+        "legacy_users", is_packed=False
+    )
+    by_row: DataFrame = data_cleaning.clean_user_data(
+        "legacy_users", is_vectorized=False, is_packed=False
+    )
+
+    columns: List[str] = [column for column in users.columns if column != "user_uuid"]
+    pd.testing.assert_frame_equal(
+        normalize(vectorized, columns), normalize(by_row, columns)
+    )
+    assert_same_uuids(by_row["user_uuid"], vectorized["user_uuid"], users["user_uuid"])
+    # Same dtypes, with country_code as a Categorical in both paths.
+    pd.testing.assert_series_equal(vectorized.dtypes, by_row.dtypes)
+    pd.testing.assert_series_equal(vectorized["country_code"], by_row["country_code"])
+    # Dates out of the range of pd.Timestamp are parsed, not replaced by the default.
+    assert vectorized["date_of_birth"][1] == date(1, 1, 1)
+
+
+@pytest.fixture
+def orders() -> DataFrame:
+    return pd.DataFrame(
+        {
+            "level_0": range(7),
+            "index": range(7),
+            "date_uuid": [
+                f"{UUID_PREFIX}0",
+                INVALID_UUID,
+                f"{UUID_PREFIX}2",
+                np.nan,
+                f"{UUID_PREFIX}4",
+                f"{UUID_PREFIX}5",
+                "bad",
+            ],
+            "first_name": [None] * 7,
+            "last_name": [None] * 7,
+            "user_uuid": [f"{UUID_PREFIX}{number}" for number in range(7)],
+            "card_number": [
+                4000000000000000,
+                "4111111111111111",
+                "??4222222222222",
+                "NULL",
+                30000000000000,
+                "",
+                "5555555555554444",
+            ],
+            "store_code": [
+                "WEB-1388012W",
+                "BL-8387506C",
+                "NULL",
+                "HI-9B97EE4E",
+                "bad",
+                "WEB-1388012W",
+                "GB-123",
+            ],
+            "product_code": [
+                "R7-3126933h",
+                "C2-7287916l",
+                "S7-1175877v",
+                "x",
+                "A8-1",
+                np.nan,
+                "D8-8421505n",
+            ],
+            "1": [np.nan] * 7,
+            "product_quantity": [3, "4", 11, "2", 1, 5, "7"],
+        }
+    )
+
+
+@pytest.fixture
+def stores() -> DataFrame:
+    return pd.DataFrame(
+        {
+            "index": range(7),
+            "address": ["1 Road", "NULL", "N/A", "2 Street", np.nan, "", "3 Lane"],
+            "longitude": ["-0.12", "N/A", "1.5", np.nan, "13.4", "bad", "-73.9"],
+            "lat": [np.nan] * 7,
+            "locality": ["London", "NULL", "N/A", "Berlin2", "Berlin", "", "New York"],
+            "store_code": [
+                "WEB-1388012W",
+                "BL-8387506C",
+                "NULL",
+                "HI-9B97EE4E",
+                "bad",
+                "NY-12345678",
+                "GB-ABCDEFGH",
+            ],
+            "staff_numbers": ["325", "34", "J78", "NULL", "1", "3n9", "80"],
+            "opening_date": [
+                "2010-06-12",
+                "0001-01-01",
+                "October 2012 08",
+                "1996 October 25",
+                "2002/05/13",
+                "13/05/2002",
+                np.nan,
+            ],
+            "store_type": [
+                "Web Portal",
+                "Local",
+                "NULL",
+                "Super Store",
+                "Mall Kiosk",
+                "Unknown",
+                "Outlet",
+            ],
+            "latitude": ["51.5", "N/A", "52.1", "52.5", np.nan, "x", "40.7"],
+            "country_code": ["GB", "DE", "US", "DE", "DE", "XX", "US"],
+            "continent": [
+                "Europe",
+                "eeEurope",
+                "America",
+                "eeAmerica",
+                "Europe",
+                "Asia",
+                np.nan,
+            ],
+        }
+    )
+
+
+def test_clean_orders_data_parallel_matches_serial(orders: DataFrame):
+    data_cleaning: DataCleaning = DataCleaning()
+    serial: DataFrame = data_cleaning.clean_orders_data(orders.copy(), is_packed=False)
+    parallel: DataFrame = data_cleaning.clean_orders_data(
+        orders.copy(), workers=2, partition_size=3, is_packed=False
+    )
+
+    uuid_columns: List[str] = ["date_uuid", "user_uuid"]
+    columns: List[str] = [
+        column for column in serial.columns if column not in uuid_columns
+    ]
+    assert list(parallel.columns) == list(serial.columns)
+    pd.testing.assert_frame_equal(
+        normalize(parallel, columns), normalize(serial, columns)
+    )
+    for column in uuid_columns:
+        assert_same_uuids(serial[column], parallel[column], orders[column])
+
+
+def test_clean_store_data_parallel_matches_serial(stores: DataFrame):
+    data_cleaning: DataCleaning = DataCleaning()
+    serial, serial_rejected = data_cleaning.clean_store_data(
+        stores.copy(), with_rejected=True
+    )
+    parallel, parallel_rejected = data_cleaning.clean_store_data(
+        stores.copy(), with_rejected=True, workers=2, partition_size=3
+    )
+
+    pd.testing.assert_frame_equal(parallel, serial)
+    pd.testing.assert_frame_equal(parallel_rejected, serial_rejected)
+
+
+@pytest.mark.parametrize(
+    "weights",
+    [
+        [np.nan, np.nan],
+        [1.5, np.nan],
+        ["2 x 200g", "1kg", np.nan, "77g .", "500ml", "16oz", "NULL"],
+    ],
+)
+def test_parse_weights_matches_clean_weight(weights: list):
+    data_cleaning: DataCleaning = DataCleaning()
+    column: pd.Series = pd.Series(weights, index=range(3, 3 + len(weights)))
+
+    parsed, _ = data_cleaning.parse_weights(column)
+
+    expected: pd.Series = column.map(data_cleaning.clean_weight)
+    assert parsed.index.equals(column.index)
+    pd.testing.assert_series_equal(
+        pd.to_numeric(parsed), pd.to_numeric(expected), check_dtype=False
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_rejected_rows_keep_the_raw_key(stores: DataFrame, workers: int):
+    data_cleaning: DataCleaning = DataCleaning()
+    cards: DataFrame = pd.DataFrame(
+        {
+            "card_number": ["4654492346226715", "NULL", "???4971858637664481", "?"],
+            "expiry_date": ["09/26", "NULL", "10/23", "11/25"],
+            "card_provider": ["VISA 16 digit", "NULL", "VISA 16 digit", "Maestro"],
+            "date_payment_confirmed": ["2015-11-25", "NULL", "2002-01-01", "NULL"],
+        }
+    )
+
+    _, rejected_stores = data_cleaning.clean_store_data(
+        stores.copy(), with_rejected=True, workers=workers, partition_size=3
+    )
+    _, rejected_cards = data_cleaning.clean_card_data(
+        cards, with_rejected=True, workers=workers, partition_size=2
+    )
+
+    assert rejected_stores["index"].tolist() == [2, 4]
+    assert rejected_stores["store_code"].tolist() == ["NULL", "bad"]
+    assert rejected_cards.index.tolist() == [1, 3]
+    assert rejected_cards["card_number"].tolist() == ["NULL", "?"]
@@ -0,0 +1,168 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import io
+import json
+import threading
+import time
+from typing import Iterator, List
+
+import boto3
+import numpy as np
+import pandas as pd
+import pytest
+from moto import mock_aws
+from pandas import DataFrame
+from pypdf import PdfWriter
+
+from database_manager import data_extraction
+from database_manager.data_extraction import DataExtractor
+
+NUMBER_OF_STORES = 6
+# Status of the first requests of each store, before the 200 response.
+FAILED_STATUS = [429, 500]
+
+
+class StoresHandler(BaseHTTPRequestHandler):
+    """
+    Stub of the store details api: each store fails with FAILED_STATUS first and
+    the first stores are answered the slowest, so they are completed the last.
+    """
+
+    requests: Counter = Counter()
+    lock: threading.Lock = threading.Lock()
+
+    def do_GET(self):
+        store_number: int = int(self.path.rsplit("/", 1)[-1])
+        with self.lock:
+            self.requests[store_number] += 1
+            attempt: int = self.requests[store_number]
+        if attempt <= len(FAILED_STATUS):
+            self.send_response(FAILED_STATUS[attempt - 1])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        time.sleep(0.05 * (NUMBER_OF_STORES - store_number))
+        body: bytes = json.dumps(
+            {"index": store_number, "store_code": f"ST-{store_number}"}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stores_url() -> Iterator[str]:
+    StoresHandler.requests = Counter()
+    server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), StoresHandler)
+    thread: threading.Thread = threading.Thread(
+        target=server.serve_forever, daemon=True
+    )
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/prod/store_details"
+    server.shutdown()
+    server.server_close()
+
+
+def test_retrieve_stores_data_retries_and_keeps_order(
+    monkeypatch, tmp_path, stores_url: str
+):
+    monkeypatch.setattr(DataExtractor, "_HTTP_BACKOFF_FACTOR", 0)
+    extractor: DataExtractor = DataExtractor(
+        config={
+            "x-api-key": "key",
+            "aws_url_store_details": stores_url,
+            "http_cache": False,
+            "pdf_cache": False,
+        }
+    )
+    journal_path: str = str(tmp_path / "stores_journal.jsonl")
+
+    df: DataFrame = extractor.retrieve_stores_data(
+        NUMBER_OF_STORES, workers=NUMBER_OF_STORES, journal_path=journal_path
+    )
+
+    # Every store was retried after the 429 and the 500 responses.
+    assert StoresHandler.requests == {
+        store_number: len(FAILED_STATUS) + 1 for store_number in range(NUMBER_OF_STORES)
+    }
+    assert df["index"].tolist() == list(range(NUMBER_OF_STORES))
+    assert df["store_code"].tolist() == [
+        f"ST-{store_number}" for store_number in range(NUMBER_OF_STORES)
+    ]
+    assert not (tmp_path / "stores_journal.jsonl").exists()
+
+
+@pytest.fixture
+def s3_object(monkeypatch) -> Iterator[bytes]:
+    """
+    Csv object orders.csv of the bucket data-bucket (in a mocked S3) and its body.
+    """
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "eu-west-1")
+    df: DataFrame = pd.DataFrame(
+        {
+            "product_code": [f"A{number}-{number * 7}" for number in range(25)],
+            "product_quantity": range(25),
+            "weight": [number / 3 if number % 4 else np.nan for number in range(25)],
+            "store_code": ["WEB-1388012W", "", "NULL", "a,b", 'say "hi"'] * 5,
+        }
+    )
+    body: bytes = df.to_csv().encode()
+    with mock_aws():
+        s3 = boto3.client("s3", region_name="eu-west-1")
+        s3.create_bucket(
+            Bucket="data-bucket",
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-1"},
+        )
+        s3.put_object(Bucket="data-bucket", Key="orders.csv", Body=body)
+        yield body
+
+
+def test_stream_from_s3_matches_read_csv(s3_object: bytes):
+    extractor: DataExtractor = DataExtractor(
+        config={"http_cache": False, "pdf_cache": False}
+    )
+
+    chunks: List[DataFrame] = list(
+        extractor.stream_from_s3("data-bucket", "orders.csv", chunksize=7)
+    )
+
+    assert [len(chunk) for chunk in chunks] == [7, 7, 7, 4]
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks), pd.read_csv(io.BytesIO(s3_object), index_col=0)
+    )
+
+
+def test_retrieve_pdf_data_reads_one_range_of_pages_per_worker(monkeypatch, tmp_path):
+    pdf_path: str = str(tmp_path / "cards.pdf")
+    writer: PdfWriter = PdfWriter()
+    for _ in range(11):
+        writer.add_blank_page(width=200, height=200)
+    writer.write(pdf_path)
+
+    page_ranges: List[List[int]] = []
+
+    def read_pdf_pages(pdf_path: str, pages: List[int], backend: str):
+        page_ranges.append(pages)
+        return [pd.DataFrame({"page": pages})]
+
+    # Threads instead of processes, so the page ranges are seen by the test.
+    monkeypatch.setattr(data_extraction, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(DataExtractor, "_read_pdf_pages", staticmethod(read_pdf_pages))
+    extractor: DataExtractor = DataExtractor(
+        config={"http_cache": False, "pdf_cache": False}
+    )
+
+    df: DataFrame = extractor.retrieve_pdf_data(pdf_path, workers=3)
+
+    # Each tabula task starts a Java VM, so there is one task per worker.
+    assert sorted(page_ranges) == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11]]
+    assert df["page"].tolist() == list(range(1, 12))
@@ -0,0 +1,91 @@
+import random
+import uuid
+
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from database_manager import identifiers
+from database_manager.data_cleaning import DataCleaning
+
+NUMBER_OF_ORDERS = 5000
+
+
+@pytest.fixture
+def orders() -> DataFrame:
+    """
+    Orders with a few hundred store and product codes, like the RDS orders table.
+    """
+    generator: random.Random = random.Random(0)
+    stores = [f"BL-{generator.getrandbits(32):08X}" for _ in range(300)]
+    products = [
+        f"{generator.choice('ABCDEFGHRS')}{generator.randint(0, 9)}-{generator.randint(1000, 9999999)}{generator.choice('abcdefgh')}"
+        for _ in range(1000)
+    ]
+    return pd.DataFrame(
+        {
+            "index": range(NUMBER_OF_ORDERS),
+            "date_uuid": [
+                str(uuid.UUID(int=generator.getrandbits(128)))
+                for _ in range(NUMBER_OF_ORDERS)
+            ],
+            "user_uuid": [
+                str(uuid.UUID(int=generator.getrandbits(128)))
+                for _ in range(NUMBER_OF_ORDERS)
+            ],
+            "card_number": [
+                generator.choice(
+                    [
+                        generator.randint(10**15, 10**16 - 1),
+                        str(generator.randint(10**15, 10**16 - 1)),
+                        f"???{generator.randint(10**15, 10**16 - 1)}",
+                        # 19 digits VISA numbers fit in int64.
+                        "4252720361802860591",
+                    ]
+                )
+                for _ in range(NUMBER_OF_ORDERS)
+            ],
+            "store_code": [generator.choice(stores) for _ in range(NUMBER_OF_ORDERS)],
+            "product_code": [
+                generator.choice(products) for _ in range(NUMBER_OF_ORDERS)
+            ],
+            "product_quantity": [
+                generator.randint(1, 12) for _ in range(NUMBER_OF_ORDERS)
+            ],
+        }
+    )
+
+
+def test_clean_orders_data_packs_identifiers(orders: DataFrame):
+    data_cleaning: DataCleaning = DataCleaning()
+    unpacked: DataFrame = data_cleaning.clean_orders_data(
+        orders.copy(), is_packed=False
+    )
+    packed: DataFrame = data_cleaning.clean_orders_data(orders.copy())
+
+    assert packed["date_uuid_hi"].dtype == "uint64"
+    assert packed["card_number"].dtype == "Int64"
+    assert isinstance(packed["store_code"].dtype, pd.CategoricalDtype)
+    # The packed orders use a fraction of the memory.
+    assert (
+        packed.memory_usage(deep=True).sum() * 4
+        < unpacked.memory_usage(deep=True).sum()
+    )
+
+    restored: DataFrame = identifiers.unpack_identifiers(packed)
+    assert list(restored.columns) == list(unpacked.columns)
+    for column in ["date_uuid", "user_uuid"]:
+        assert restored[column].tolist() == unpacked[column].map(uuid.UUID).tolist()
+    assert restored["card_number"].tolist() == unpacked["card_number"].tolist()
+    assert restored["store_code"].tolist() == unpacked["store_code"].tolist()
+
+
+def test_pack_integers_rejects_values_that_are_not_integers():
+    column: pd.Series = pd.Series([4252720361802860591, None, "12x"], name="number")
+
+    with pytest.raises(ValueError, match="number"):
+        identifiers.pack_integers(column)
+    assert identifiers.pack_integers(column[:2]).tolist() == [
+        4252720361802860591,
+        pd.NA,
+    ]
@@ -0,0 +1,73 @@
+import json
+from typing import Iterator
+
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from database_manager import json_stream
+
+DOCUMENTS = {
+    "columns": {
+        "timestamp": {"0": "22:00:06", "1": "17:24:}]", "2": "14:55:05"},
+        "month": {"0": "9", "1": "2", "2": "Juñ{[\\"},
+        "year": {"0": "2012", "1": "1997", "2": "2012"},
+        "day": {"0": "19", "1": "10", "2": "日本語"},
+        "time_period": {"0": "Evening", "1": "Late_Hours", "2": None},
+        "price": {"0": 12345.675, "1": -2.5e-10, "2": 100000},
+    },
+    "different_indexes": {
+        "day": {"0": "19", "1": "10", "2": "1"},
+        "month": {"1": "2", "2": "6", "3": "ö"},
+        "number": {"0": 1234567890123, "3": 0.125},
+    },
+    # Values that are not objects are parsed alone, so a number can end a chunk.
+    "numbers": {
+        "day": {"0": "19", "1": "10"},
+        "total": 12345.675,
+        "rate": -2.5e-10,
+        "count": 1234567890123,
+    },
+    "records": [
+        {"product": "a}]", "price": 1.75, "weight": 12},
+        {"product": "€ 5 ]", "price": -0.5e3, "weight": None},
+        {"product": "日本", "price": 3, "weight": 1e-5},
+    ],
+}
+
+
+def chunks_of(body: bytes, chunk_size: int) -> Iterator[bytes]:
+    """
+    * Parameters:
+        - body: bytes
+        - chunk_size: integer
+    """
+    for start in range(0, len(body), chunk_size):
+        yield body[start : start + chunk_size]
+
+
+@pytest.mark.parametrize("indent", [None, 1])
+@pytest.mark.parametrize("name", DOCUMENTS)
+def test_read_dataframe_matches_json_loads(name: str, indent: int):
+    body: bytes = json.dumps(
+        DOCUMENTS[name], ensure_ascii=False, indent=indent
+    ).encode()
+    expected: DataFrame = DataFrame.from_records(json.loads(body))
+
+    # Every chunk size splits the strings, the numbers and the multibyte characters
+    # in other places.
+    for chunk_size in range(1, len(body) + 1):
+        pd.testing.assert_frame_equal(
+            json_stream.read_dataframe(chunks_of(body, chunk_size)), expected
+        )
+
+
+@pytest.mark.parametrize("trailing", [b" x", b"{}", b"]"])
+def test_read_dataframe_rejects_trailing_data(trailing: bytes):
+    body: bytes = json.dumps(DOCUMENTS["columns"]).encode() + trailing
+
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(body)
+    for chunk_size in [1, 7, len(body)]:
+        with pytest.raises(json.JSONDecodeError):
+            json_stream.read_dataframe(chunks_of(body, chunk_size))
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from database_manager.data_cleaning import DataCleaning
+from database_manager.pdf_cache import PdfTableCache
+
+
+@pytest.fixture
+def cards() -> DataFrame:
+    """
+    Pages of the card details pdf: clean (int64), with missing values (float64) and
+    with invalid card numbers (strings), concatenated like retrieve_pdf_data does.
+    """
+    pages = [
+        pd.DataFrame(
+            {
+                "card_number": [4654492346226715, 30060773296197],
+                "expiry_date": ["09/26", "11/25"],
+                "card_provider": ["VISA 16 digit", "Diners Club / Carte Blanche"],
+                "date_payment_confirmed": ["2015-11-25", "2001-06-18"],
+            }
+        ),
+        pd.DataFrame(
+            {
+                "card_number": [4971858637664481.0, np.nan],
+                "expiry_date": ["10/23", "NULL"],
+                "card_provider": ["VISA 16 digit", "NULL"],
+                "date_payment_confirmed": ["2002 January 01", "NULL"],
+            }
+        ),
+        pd.DataFrame(
+            {
+                "card_number": ["NULL", "???4654492346226715", "4252720361802860591"],
+                "expiry_date": ["NULL", "09/26", "10/25"],
+                "card_provider": ["NULL", "VISA 16 digit", "VISA 19 digit"],
+                "date_payment_confirmed": ["NULL", "2015-11-25", "1995/10/19"],
+            }
+        ),
+    ]
+    return pd.concat(pages, ignore_index=True)
+
+
+def test_mixed_object_column_round_trips(tmp_path, cards: DataFrame):
+    cache: PdfTableCache = PdfTableCache(str(tmp_path))
+
+    cache.put("cards", cards)
+    cached: DataFrame = cache.get("cards")
+
+    assert cached is not None
+    assert cached["card_number"].tolist() == [
+        "4654492346226715",
+        "30060773296197",
+        "4971858637664481",
+        None,
+        "NULL",
+        "???4654492346226715",
+        "4252720361802860591",
+    ]
+    pd.testing.assert_frame_equal(
+        cached.drop(columns="card_number"), cards.drop(columns="card_number")
+    )
+    # The cached card numbers are cleaned like the extracted ones (clean_integer_number
+    # does not accept missing values).
+    data_cleaning: DataCleaning = DataCleaning()
+    pd.testing.assert_frame_equal(
+        data_cleaning.clean_card_data(cached.dropna(subset=["card_number"]).copy()),
+        data_cleaning.clean_card_data(cards.dropna(subset=["card_number"]).copy()),
+    )
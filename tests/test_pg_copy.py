@@ -0,0 +1,58 @@
+from datetime import date
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from database_manager import pg_copy
+
+NULL = "\\N"
+
+
+def test_to_copy_text_writes_the_text_format_of_copy():
+    user_uuid: uuid.UUID = uuid.UUID("a0eebc99-9c0b-4ef8-bb6d-6bb9bd380a11")
+    df: pd.DataFrame = pd.DataFrame(
+        {
+            "index": [0, 1, 2, 3],
+            "name": ["", None, "a\tb\\c", "l1\nl2\r"],
+            "quote": ['say "hi"', "é日本", "\\N", np.nan],
+            "product_quantity": [1.0, 2.6, np.nan, -3.5],
+            "weight": [0.5, np.nan, 1.0, 2.25],
+            "card_number": pd.array([4252720361802860591, None, 1, 0], dtype="Int64"),
+            "store_type": pd.Categorical(["Web Portal", None, "Local", "Web Portal"]),
+            "opening_date": [date(2020, 1, 2), None, date(1, 1, 1), date(2021, 12, 31)],
+            "join_date": pd.to_datetime(
+                ["2020-01-01", None, "1999-12-31", "2021-06-30"]
+            ),
+            "still_available": [True, False, True, False],
+            "user_uuid": [user_uuid, None, user_uuid, user_uuid],
+        }
+    )
+
+    text: str = pg_copy._to_copy_text(df, {"index", "product_quantity"}).getvalue()
+
+    expected_rows = [
+        # An empty string is not NULL, and the strings are not quoted.
+        ["0", "", 'say "hi"', "1", "0.5", "4252720361802860591", "Web Portal"]
+        + ["2020-01-02", "2020-01-01", "True", str(user_uuid)],
+        # NULL of each type.
+        ["1", NULL, "é日本", "3", NULL, NULL, NULL, NULL, NULL, "False", NULL],
+        # Backslashes and tabs are escaped, so "\N" is a string and not NULL.
+        ["2", "a\\tb\\\\c", "\\\\N", NULL, "1.0", "1", "Local"]
+        + ["0001-01-01", "1999-12-31", "True", str(user_uuid)],
+        # Newlines are escaped and the floats of integer columns are rounded.
+        ["3", "l1\\nl2\\r", NULL, "-4", "2.25", "0", "Web Portal"]
+        + ["2021-12-31", "2021-06-30", "False", str(user_uuid)],
+    ]
+    assert text == "".join("\t".join(row) + "\n" for row in expected_rows)
+
+
+def test_to_copy_text_keeps_the_dataframe():
+    df: pd.DataFrame = pd.DataFrame(
+        {"product_quantity": [1.4, np.nan], "name": ["a\tb", None]}
+    )
+    original: pd.DataFrame = df.copy()
+
+    pg_copy._to_copy_text(df, {"product_quantity"})
+
+    pd.testing.assert_frame_equal(df, original)
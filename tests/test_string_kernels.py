@@ -0,0 +1,112 @@
+import re
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from database_manager import string_kernels
+from database_manager.data_cleaning import DataCleaning
+
+STRINGS = [
+    "WEB-1388012W",
+    "WEB-1388012W\n",
+    "WEB-1388012W\n\n",
+    "a$b",
+    "a$b\n",
+    "x]$",
+    "john@example.com\n",
+    "£12.50",
+    "",
+    np.nan,
+    None,
+]
+PATTERNS = [
+    r"^[A-Z]{2,3}-[A-Z0-9]{8}$",
+    r"^[\w0-9_.+-]+@[\w-]{2,}\.[\w]{2,}[\.\w]{0,}$",
+    r"\d$",
+    r"a\$b",
+    r"[$]b$",
+    r"[]$]$",
+    r"[^]$]$",
+    r"W|\n$",
+]
+
+
+def search(column: pd.Series, pattern: str) -> List[bool]:
+    """
+    Result of re.search for each value (False if it is not a string).
+
+    * Parameters:
+        - column: Series
+        - pattern: string
+    """
+    return [
+        isinstance(value, str) and re.search(pattern, value) is not None
+        for value in column
+    ]
+
+
+def sub(column: pd.Series, pattern: str, replacement: str) -> List:
+    """
+    Result of re.sub for each string value (the other values are kept).
+
+    * Parameters:
+        - column: Series
+        - pattern: string
+        - replacement: string
+    """
+    return [
+        re.sub(pattern, replacement, value) if isinstance(value, str) else value
+        for value in column
+    ]
+
+
+@pytest.fixture(params=["strings", "mixed"])
+def column(request) -> pd.Series:
+    """
+    Strings and missing values (which run in Arrow), or also an integer (pandas).
+    """
+    values: List = STRINGS if request.param == "strings" else STRINGS + [12]
+    return pd.Series(values, index=range(10, 10 + len(values)), dtype=object)
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_contains_matches_python_re(column: pd.Series, pattern: str):
+    assert string_kernels.contains(column, pattern).tolist() == search(column, pattern)
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_replace_matches_python_re(column: pd.Series, pattern: str):
+    replaced: pd.Series = string_kernels.replace(column, pattern, "#")
+
+    assert replaced.index.equals(column.index)
+    assert [None if pd.isna(value) else value for value in replaced] == [
+        None if pd.isna(value) else value for value in sub(column, pattern, "#")
+    ]
+
+
+def test_is_string_with_missing_values(column: pd.Series):
+    assert string_kernels.is_string(column).tolist() == [
+        isinstance(value, str) for value in column
+    ]
+    assert not string_kernels.is_string(pd.Series([np.nan, 1.5])).any()
+
+
+def test_store_code_rule_matches_clean_store_code():
+    data_cleaning: DataCleaning = DataCleaning()
+    store_codes: List[str] = [
+        "WEB-1388012W",
+        "WEB-1388012W\n",
+        "BL-8387506C ",
+        "GB-123",
+    ]
+    df: pd.DataFrame = pd.DataFrame(
+        {"locality": ["London"] * len(store_codes), "store_code": store_codes}
+    )
+
+    cleaned: pd.DataFrame = data_cleaning._STORES_RULES.apply(df)
+
+    assert cleaned["store_code"].tolist() == [
+        data_cleaning.clean_store_code(store_code) for store_code in store_codes
+    ]